@@ -13,14 +13,31 @@ Date: 2024-2025
 """
 
 import requests
-from typing import Dict, List, Optional, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+import numpy as np
+from typing import Dict, List, Optional, Any, Tuple, Callable, TYPE_CHECKING
 from datetime import datetime
 import json
-from dataclasses import dataclass, asdict
+import hashlib
+import re
+from dataclasses import dataclass, asdict, astuple
 from enum import Enum
 import time
+import random
+import math
+import bisect
+import heapq
+import itertools
 import os
 import sys
+import threading
+import logging
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from operator import itemgetter
 
 # Try to import dotenv, but don't fail if it's not available
 try:
@@ -31,14 +48,85 @@ except ImportError:
 except Exception as e:
     print(f"Warning: Could not load .env file: {e}")
 
+if TYPE_CHECKING:
+    import pandas as pd  # Imported on first use; only the per-game frame path needs it
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for JSON (de)serialization; fall back to the standard library
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+# requests-cache adds HTTP-level caching with conditional GETs when installed
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts(timestamp: str) -> datetime:
+    """Parse an Odds API ISO timestamp; the same few strings repeat across every outcome"""
+    try:
+        return datetime.fromisoformat(timestamp)  # Accepts a trailing 'Z' on Python 3.11+
+    except ValueError:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+_TEAM_STRIP = str.maketrans('', '', ' .')
+
+
+@lru_cache(maxsize=256)
+def _normalize_team(team: str) -> str:
+    """Normalize team names for comparison"""
+    return team.lower().translate(_TEAM_STRIP)
+
+
+def cached_response(key: Callable[..., str], ttl: Callable[..., float], default: Callable[[], Any] = list):
+    """
+    Route an analyzer fetch method through its response cache.
+    
+    The decorated method performs the actual API request and returns None on
+    failure. key and ttl are called with the same arguments as the method to
+    build the cache key and the TTL of a fresh response. Calls accept an extra
+    force_fresh keyword, and return default() when nothing is cached and the
+    fetch fails.
+    """
+    def decorate(fetch: Callable[..., Optional[Any]]) -> Callable[..., Any]:
+        @wraps(fetch)
+        def wrapper(self, *args, force_fresh: bool = False):
+            return self._cached_fetch(
+                key(self, *args),
+                lambda: fetch(self, *args),
+                lambda: ttl(self, *args),
+                default=default(),
+                force_fresh=force_fresh
+            )
+        return wrapper
+    return decorate
+
 
 class ProgressBar:
     """Simple progress bar for terminal"""
+    MIN_REDRAW_INTERVAL = 0.05  # Seconds; caps redraws at 20 per second
+    
     def __init__(self, total, description="Processing"):
         self.total = total
         self.current = 0
         self.description = description
         self.width = 40
+        self._last_draw = 0.0
         
     def update(self, increment=1):
         self.current += increment
@@ -47,6 +135,12 @@ class ProgressBar:
     def _display(self):
         if self.total == 0:
             return
+        
+        # Skip intermediate frames when updates come in faster than the terminal needs
+        now = time.monotonic()
+        if now - self._last_draw < self.MIN_REDRAW_INTERVAL and self.current < self.total:
+            return
+        self._last_draw = now
             
         progress = self.current / self.total
         filled = int(self.width * progress)
@@ -58,6 +152,95 @@ class ProgressBar:
         
         if self.current >= self.total:
             print()  # New line when complete
+    
+    def close(self):
+        """End the bar's line when stopping before the total is reached"""
+        if self._last_draw and self.current < self.total:
+            print()
+
+
+class TTLCache:
+    """
+    Small thread-safe in-memory cache with per-entry TTLs and LRU eviction.
+    
+    Bounded so long-running sessions don't keep every response ever fetched.
+    """
+    def __init__(self, maxsize: int = 512, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._lock = threading.Lock()
+        
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            if item[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return item[1]
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value, evicting the least recently used entries past maxsize"""
+        now = time.monotonic()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                # Drop expired entries before evicting anything still live
+                for expired_key in [k for k, (expiry, _) in self._data.items() if expiry <= now]:
+                    del self._data[expired_key]
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class FileCache:
+    """
+    Simple on-disk JSON cache with per-entry TTLs.
+    
+    Entries survive between runs so repeated CLI invocations in the same
+    research session don't burn Odds API quota on data we already have.
+    """
+    def __init__(self, directory: str = ".cache/odds"):
+        self.directory = directory
+        
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+        
+    def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the raw {ts, ttl, payload} entry, even if it has expired"""
+        try:
+            with open(self._path(key), 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached payload, or None if missing or expired"""
+        entry = self.get_entry(key)
+        if entry is None or time.time() - entry['ts'] >= entry['ttl']:
+            return None
+        return entry['payload']
+    
+    def set(self, key: str, value: Any, ttl_s: float):
+        """Store a payload with a time-to-live in seconds"""
+        entry = {'ts': time.time(), 'ttl': ttl_s, 'payload': value}
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(entry))
+            os.replace(tmp_path, path)  # Atomic so concurrent readers never see partial files
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", key, e)
 
 
 class Position(Enum):
@@ -108,7 +291,62 @@ class PropType(Enum):
     INTERCEPTIONS = "player_def_ints"
 
 
-@dataclass
+# Strips everything but letters so "D.J. Moore" and "DJ Moore" share a key
+_NORM_RE = re.compile(r'[^a-z]')
+
+# Integer ids for prop markets, used to aggregate lines with NumPy
+_PROP_ORDER = tuple(pt.value for pt in PropType)
+_PROP_ID = {prop: i for i, prop in enumerate(_PROP_ORDER)}
+
+# Props each position is projected from, with the confidence placed in each
+# (yardage props are the most reliable, touchdown props the least)
+_POSITION_PROPS = {
+    Position.QB: ((PropType.PASS_YARDS, 0.8), (PropType.PASS_TDS, 0.7),
+                  (PropType.RUSH_YARDS, 0.6), (PropType.RUSH_TDS, 0.5)),
+    Position.RB: ((PropType.RUSH_YARDS, 0.8), (PropType.RUSH_TDS, 0.6),
+                  (PropType.RECEPTIONS, 0.7), (PropType.RECEIVING_YARDS, 0.7)),
+    Position.WR: ((PropType.RECEPTIONS, 0.8), (PropType.RECEIVING_YARDS, 0.8),
+                  (PropType.RECEIVING_TDS, 0.6)),
+    Position.TE: ((PropType.RECEPTIONS, 0.8), (PropType.RECEIVING_YARDS, 0.8),
+                  (PropType.RECEIVING_TDS, 0.6)),  # Same as WR for most leagues
+}
+
+# Rows of the projection matrices
+_POS_ID = {pos: i for i, pos in enumerate(_POSITION_PROPS)}
+
+# Breakdown category reported for each projected prop
+_BREAKDOWN_LABELS = {
+    PropType.PASS_YARDS.value: 'passing_yards',
+    PropType.PASS_TDS.value: 'passing_tds',
+    PropType.RUSH_YARDS.value: 'rushing_yards',
+    PropType.RUSH_TDS.value: 'rushing_tds',
+    PropType.RECEPTIONS.value: 'receptions',
+    PropType.RECEIVING_YARDS.value: 'receiving_yards',
+    PropType.RECEIVING_TDS.value: 'receiving_tds',
+}
+
+# (position × prop) confidence weights; zero where a prop isn't used
+_CONFIDENCE = np.zeros((len(_POS_ID), len(_PROP_ORDER)))
+for _pos, _props in _POSITION_PROPS.items():
+    for _prop, _confidence in _props:
+        _CONFIDENCE[_POS_ID[_pos], _PROP_ID[_prop.value]] = _confidence
+
+# Per position: (prop id, breakdown label, confidence) for each projected prop
+_POSITION_COLUMNS = {
+    pos: tuple((_PROP_ID[prop.value], _BREAKDOWN_LABELS[prop.value], confidence) for prop, confidence in props)
+    for pos, props in _POSITION_PROPS.items()
+}
+
+# Markets requested when no specific prop types are asked for
+_DEFAULT_MARKETS = ','.join(pt.value for pt in (
+    PropType.PASS_TDS, PropType.PASS_YARDS, PropType.PASS_COMPLETIONS, PropType.PASS_ATTEMPTS,
+    PropType.RUSH_YARDS, PropType.RUSH_TDS, PropType.RUSH_ATTEMPTS,
+    PropType.RECEIVING_YARDS, PropType.RECEIVING_TDS, PropType.RECEPTIONS,
+    PropType.ANYTIME_TD, PropType.FIRST_TD,
+))
+
+
+@dataclass(frozen=True, slots=True)
 class FantasyScoring:
     """Data class for fantasy league scoring settings"""
     # Passing
@@ -140,7 +378,7 @@ class FantasyScoring:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class BettingLine:
     """Data class for a single betting line"""
     player_name: str
@@ -163,7 +401,7 @@ class BettingLine:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class FantasyProjection:
     """Data class for fantasy projections derived from betting lines"""
     player_name: str
@@ -182,7 +420,7 @@ class FantasyProjection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerRosterInfo:
     """Data class for player roster information"""
     player_name: str
@@ -207,7 +445,7 @@ class PlayerRosterInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerProps:
     """Data class containing all props and fantasy analysis for a single player"""
     player_name: str
@@ -250,6 +488,26 @@ class FantasyEdgeAnalyzer:
     # The Odds API endpoints
     ODDS_API_BASE = "https://api.the-odds-api.com/v4"
     
+    # Worker threads for concurrent API requests (network-bound)
+    MAX_WORKERS = 8
+    HTTP_POOL_SIZE = 16  # Keep-alive connections shared by the workers
+    MAX_CONCURRENT_REQUESTS = 6  # In flight at once across all pools, to stay within the rate budget
+    
+    # Retries for rate limits and transient server errors (exponential backoff)
+    MAX_RETRIES = 6
+    MAX_BACKOFF = 32  # Seconds
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    # On-disk cache TTLs (seconds), tuned to how often each kind of data changes
+    GAMES_TTL = 3600  # Schedule rarely changes within an hour
+    EVENT_PROPS_TTL = 300  # Lines move quickly close to kickoff
+    EVENT_PROPS_IDLE_TTL = 6 * 3600  # Lines far from kickoff are fairly stable
+    GAME_WINDOW_HOURS = 24  # Hours before kickoff that count as the game window
+    FRESH_REQUIRED_MINUTES = 15  # Never serve stale props this close to kickoff
+    MEMORY_CACHE_SIZE = 512  # Responses kept in memory in front of the disk cache
+    FLEX_POSITIONS = (Position.RB, Position.WR, Position.TE)  # W/R/T eligibility
+    MAX_LINEUP_DP_CELLS = 2_000_000  # Fill states × salary steps in the capped lineup DP (~16 MB per table)
+    
     # Bookmakers to fetch from (can be customized)
     DEFAULT_BOOKMAKERS = [
         "draftkings",
@@ -261,7 +519,8 @@ class FantasyEdgeAnalyzer:
         "mybookieag"
     ]
     
-    def __init__(self, api_key: Optional[str] = None, bookmakers: Optional[List[str]] = None):
+    def __init__(self, api_key: Optional[str] = None, bookmakers: Optional[List[str]] = None,
+                 cache_dir: str = ".cache/odds", offline: bool = False, verbose: bool = True):
         """
         Initialize the analyzer with API credentials.
         
@@ -269,36 +528,137 @@ class FantasyEdgeAnalyzer:
             api_key: The Odds API key (get free tier at https://the-odds-api.com).
                      If not provided, will attempt to load from ODDS_API_KEY environment variable.
             bookmakers: List of bookmaker keys to fetch from
+            cache_dir: Directory for the persistent API response cache
+            offline: Only use cached responses, whatever their age, and never call
+                     the API (for re-running analysis or backtests on a saved slate)
+            verbose: Print progress and API status messages while fetching
         """
         # Get API key from parameter or environment variable
         self.api_key = api_key or os.getenv('ODDS_API_KEY')
+        self.offline = offline
+        self.verbose = verbose
         
         # Debug: Print what we found (only show partial key for security)
         if self.api_key:
-            print(f"✅ API key loaded: {self.api_key[:8]}..." + "*" * (len(self.api_key) - 8))
-        else:
-            print("❌ No API key found in environment or parameter")
+            self._say(f"✅ API key loaded: {self.api_key[:8]}..." + "*" * (len(self.api_key) - 8))
+        elif not self.offline:  # Offline mode only reads the cache, so no key is needed
+            self._say("❌ No API key found in environment or parameter")
             
         self.bookmakers = bookmakers or self.DEFAULT_BOOKMAKERS
-        self.session = requests.Session()
+        self.session = self._create_session(cache_dir)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'application/json',
+            # gzip/deflate, plus br/zstd when their decoders are installed
+            'Accept-Encoding': ACCEPT_ENCODING
         })
-        
-        # Cache for API responses to minimize requests
-        self._cache = {}
-        self._cache_timeout = 300  # 5 minutes
+        # Retry dropped connections at the transport level; HTTP status retries
+        # (429/5xx) are handled by _request_with_retry
+        transport_retry = Retry(total=3, connect=3, read=2, status=0, backoff_factor=0.5,
+                                allowed_methods=frozenset({'GET'}), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=self.HTTP_POOL_SIZE, pool_maxsize=self.HTTP_POOL_SIZE,
+                              max_retries=transport_retry)
+        self.session.mount('https://', adapter)
+        
+        # Cache for API responses to minimize requests (in-memory L1 in front of disk)
+        self._cache_timeout = 300  # 5 minutes; after that, re-read disk in case another run refreshed it
+        self._cache = TTLCache(maxsize=self.MEMORY_CACHE_SIZE, ttl=self._cache_timeout)
+        self._cache_lock = threading.Lock()  # Guards _in_flight and _pending
+        self._file_cache = FileCache(cache_dir)
+        self._in_flight = set()  # Cache keys with a background refresh running
+        self._pending: Dict[str, Future] = {}  # Cache keys with a blocking fetch running
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        # Long-lived pool for individual event fetches, shared by every search and
+        # prefetch so nested analyses don't each spin up their own threads. Only
+        # leaf fetches go here: a task waiting on this pool could deadlock it
+        self._fetch_pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="odds-fetch")
+        self._props_index = TTLCache(maxsize=64, ttl=self._cache_timeout)  # Parsed props per payload
+        self._games_index = None  # (games list, by team, by matchup) from _index_games
         
         # Default scoring system (can be updated)
-        self.scoring = FantasyScoring()
+        self.set_scoring(FantasyScoring())
         
         # Player position mapping (would ideally come from a database)
         self.position_map = self._load_position_map()
+        self._norm_position_map = {
+            _NORM_RE.sub('', name.lower()): position for name, position in self.position_map.items()
+        }
+        
+        # Player team mapping, used to jump straight to a player's game
+        self.team_map = self._load_team_map()
+        self._team_of_player = {
+            _NORM_RE.sub('', name.lower()): team for name, team in self.team_map.items()
+        }
+        
+    @property
+    def bookmakers(self) -> List[str]:
+        """Bookmaker keys to fetch from; assign a new list to change them"""
+        return self._bookmakers
+    
+    @bookmakers.setter
+    def bookmakers(self, bookmakers: List[str]):
+        self._bookmakers = bookmakers
+        self._bookmakers_param = ','.join(bookmakers)  # Joined once, not per request
+        
+    def _say(self, message: str):
+        """Print a status message when running verbosely"""
+        if self.verbose:
+            print(message)
+        
+    def _create_session(self, cache_dir: str) -> requests.Session:
+        """HTTP session; revalidates responses with conditional GETs when requests-cache is installed"""
+        if requests_cache is None:
+            return requests.Session()
+        
+        # Our own caches decide when data is stale; the HTTP cache only lets the
+        # API answer those refreshes with 304 Not Modified instead of a full body
+        return requests_cache.CachedSession(
+            cache_name=os.path.join(cache_dir, 'http'),
+            backend='sqlite',
+            expire_after=requests_cache.EXPIRE_IMMEDIATELY,
+            cache_control=True,
+            stale_if_error=True,
+            # Keep the API key out of cache keys and the stored requests
+            ignored_parameters=['apiKey']
+        )
+        
+    @property
+    def scoring(self) -> FantasyScoring:
+        """Fantasy scoring settings; assigning new settings rebuilds the projection coefficients"""
+        return self._scoring
+    
+    @scoring.setter
+    def scoring(self, scoring: FantasyScoring):
+        self._scoring = scoring
+        self._coef = self._build_coefficients(scoring)
         
     def set_scoring(self, scoring: FantasyScoring):
         """Update the fantasy scoring settings"""
         self.scoring = scoring
         
+    def _build_coefficients(self, scoring: FantasyScoring) -> np.ndarray:
+        """
+        Build the (position × prop) matrix of fantasy points per unit of each prop,
+        so a projection is a single dot product with the consensus lines.
+        """
+        def per_yard(yards_per_point: float) -> float:
+            return 1.0 / yards_per_point if yards_per_point else 0.0
+        
+        points_per_unit = np.zeros(len(_PROP_ORDER))
+        for prop, value in (
+            (PropType.PASS_YARDS, per_yard(scoring.pass_yards_per_point)),
+            (PropType.PASS_TDS, scoring.pass_td_points),
+            (PropType.RUSH_YARDS, per_yard(scoring.rush_yards_per_point)),
+            (PropType.RUSH_TDS, scoring.rush_td_points),
+            (PropType.RECEPTIONS, scoring.reception_points),
+            (PropType.RECEIVING_YARDS, per_yard(scoring.receiving_yards_per_point)),
+            (PropType.RECEIVING_TDS, scoring.receiving_td_points),
+        ):
+            points_per_unit[_PROP_ID[prop.value]] = value
+        
+        # Only keep the props each position is projected from
+        return np.where(_CONFIDENCE > 0, points_per_unit, 0.0)
+        
     def _load_position_map(self) -> Dict[str, Position]:
         """
         Load player position mapping. In production, this would come from a database.
@@ -344,6 +704,48 @@ class FantasyEdgeAnalyzer:
             "Jaylen Smith": Position.TE,
         }
         
+    def _load_team_map(self) -> Dict[str, str]:
+        """
+        Load player team mapping. Like the position map, this would come from a
+        roster database in production; players missing here are found by
+        searching every game.
+        """
+        return {
+            "Josh Allen": "Buffalo Bills",
+            "Lamar Jackson": "Baltimore Ravens",
+            "Dak Prescott": "Dallas Cowboys",
+            "Patrick Mahomes": "Kansas City Chiefs",
+            "Joe Burrow": "Cincinnati Bengals",
+            "Justin Herbert": "Los Angeles Chargers",
+            
+            "Saquon Barkley": "Philadelphia Eagles",
+            "Christian McCaffrey": "San Francisco 49ers",
+            "Derrick Henry": "Baltimore Ravens",
+            "Alvin Kamara": "New Orleans Saints",
+            "Jonathan Taylor": "Indianapolis Colts",
+            "James Conner": "Arizona Cardinals",
+            
+            "Tyreek Hill": "Miami Dolphins",
+            "CeeDee Lamb": "Dallas Cowboys",
+            "Tee Higgins": "Cincinnati Bengals",
+            "DeVonta Smith": "Philadelphia Eagles",
+            "Darnell Mooney": "Atlanta Falcons",
+            "Jaylen Waddle": "Miami Dolphins",
+            "Mike Evans": "Tampa Bay Buccaneers",
+            
+            "Travis Kelce": "Kansas City Chiefs",
+            "Mark Andrews": "Baltimore Ravens",
+            "George Kittle": "San Francisco 49ers",
+        }
+        
+    def _lookup_team(self, player_name: str) -> Optional[str]:
+        """Look up a player's team, ignoring case and punctuation in the name"""
+        return self._team_of_player.get(_NORM_RE.sub('', player_name.lower()))
+        
+    def _lookup_position(self, player_name: str) -> Optional[Position]:
+        """Look up a player's position, ignoring case and punctuation in the name"""
+        return self._norm_position_map.get(_NORM_RE.sub('', player_name.lower()))
+        
     def get_player_analysis(self, player_name: str, prop_types: Optional[List[PropType]] = None) -> PlayerProps:
         """
         Get comprehensive fantasy analysis for a specific player including betting lines and projections.
@@ -355,36 +757,85 @@ class FantasyEdgeAnalyzer:
         Returns:
             PlayerProps object containing betting lines and fantasy projections
         """
-        if not self.api_key:
+        analysis = self._collect_player_props(player_name, prop_types)
+        analysis.fantasy_projection = self._generate_fantasy_projection(
+            player_name, analysis.position, analysis.betting_lines
+        )
+        return analysis
+    
+    def _collect_player_props(self, player_name: str, prop_types: Optional[List[PropType]] = None,
+                              quiet: bool = False) -> PlayerProps:
+        """
+        Fetch a player's betting lines and roster info, without projecting them.
+        
+        quiet skips the per-player status line and search progress bar, for
+        batch callers that draw their own progress.
+        """
+        if not self.api_key and not self.offline:
             raise ValueError("API key required. Get one free at https://the-odds-api.com")
         
-        print(f"🔍 Analyzing {player_name}...")
+        if not quiet:
+            self._say(f"🔍 Analyzing {player_name}...")
         
         # Get betting lines (using existing logic)
         games = self._get_nfl_games()
         all_props = []
-        player_team = None
-        player_opponent = None
-        game_time = None
+        found_game = None
         
-        # Progress bar for game analysis
-        progress = ProgressBar(len(games), f"Searching for {player_name}")
-        
-        for game in games:
-            progress.update()
-            event_props = self._get_event_props(game['id'], prop_types)
-            player_lines = self._filter_player_props(event_props, player_name)
-            
+        # Go straight to the player's game when their team is known
+        team = self._lookup_team(player_name)
+        known_game = self._index_games(games)[0].get(self._normalize_team_name(team)) if team else None
+        if known_game:
+            player_lines = self._filter_player_props(self._get_event_props(known_game['id'], prop_types), player_name)
             if player_lines:
                 all_props.extend(player_lines)
-                if not player_team:
-                    player_team = self._determine_player_team(game, player_name)
-                    player_opponent = game['away_team'] if player_team == game['home_team'] else game['home_team']
-                    game_time = datetime.fromisoformat(game['commence_time'].replace('Z', '+00:00'))
-                break
+                found_game = known_game
+        
+        # Otherwise search the remaining games
+        if found_game is None:
+            remaining = [game for game in games if game is not known_game]
+            
+            # Progress bar for game analysis
+            progress = None if quiet else ProgressBar(len(remaining), f"Searching for {player_name}")
+            
+            # Fetch event props concurrently and stop at the first game with the player
+            futures = {
+                self._fetch_pool.submit(self._get_event_props, game['id'], prop_types): game
+                for game in remaining
+            }
+            try:
+                for future in as_completed(futures):
+                    if progress:
+                        progress.update()
+                    try:
+                        event_props = future.result()
+                    except requests.RequestException as e:
+                        # One unreachable game shouldn't end the search
+                        logger.debug("Could not fetch props for %s: %s", futures[future]['id'], e)
+                        continue
+                    player_lines = self._filter_player_props(event_props, player_name)
+                    
+                    if player_lines:
+                        all_props.extend(player_lines)
+                        found_game = futures[future]
+                        break
+            finally:
+                # Don't wait on the remaining games once the player has been found
+                for future in futures:
+                    future.cancel()
+                if progress:
+                    progress.close()
+        
+        player_team = None
+        player_opponent = None
+        game_time = None
+        if found_game:
+            player_team = self._determine_player_team(found_game, player_name)
+            player_opponent = found_game['away_team'] if player_team == found_game['home_team'] else found_game['home_team']
+            game_time = _parse_ts(found_game['commence_time'])
         
         # Get player position
-        position = self.position_map.get(player_name)
+        position = self._lookup_position(player_name)
         
         # Create roster info
         roster_info = PlayerRosterInfo(
@@ -395,15 +846,12 @@ class FantasyEdgeAnalyzer:
             game_time=game_time or datetime.now()
         ) if player_team else None
         
-        # Generate fantasy projection
-        fantasy_projection = self._generate_fantasy_projection(player_name, position, all_props)
-        
         return PlayerProps(
             player_name=player_name,
             position=position,
             roster_info=roster_info,
             betting_lines=all_props,
-            fantasy_projection=fantasy_projection
+            fantasy_projection=None
         )
     
     def compare_players(self, player1_name: str, player2_name: str) -> Dict[str, Any]:
@@ -451,13 +899,16 @@ class FantasyEdgeAnalyzer:
             }
         }
     
-    def optimize_lineup(self, roster_players: List[str], lineup_requirements: Optional[Dict[Position, int]] = None) -> Dict[str, Any]:
+    def optimize_lineup(self, roster_players: List[str], lineup_requirements: Optional[Dict[Position, int]] = None,
+                       flex_spots: int = 0, salary_cap: Optional[int] = None) -> Dict[str, Any]:
         """
         Optimize fantasy lineup from available roster players.
         
         Args:
             roster_players: List of player names on your roster
             lineup_requirements: Dictionary of position requirements (e.g., {Position.QB: 1, Position.RB: 2})
+            flex_spots: Number of FLEX (RB/WR/TE) slots to fill
+            salary_cap: Optional DFS salary cap; players without a salary count as 0
             
         Returns:
             Dictionary with optimal lineup and analysis
@@ -474,27 +925,15 @@ class FantasyEdgeAnalyzer:
         
         print(f"🎯 Optimizing lineup from {len(roster_players)} players...")
         
-        # Get analysis for all roster players
-        player_analyses = {}
-        progress = ProgressBar(len(roster_players), "Analyzing roster")
-        
-        for player_name in roster_players:
-            progress.update()
-            try:
-                analysis = self.get_player_analysis(player_name)
-                if analysis.fantasy_projection:
-                    player_analyses[player_name] = analysis
-            except Exception as e:
-                print(f"\n⚠️  Could not analyze {player_name}: {e}")
-                continue
+        # Get analysis for all roster players concurrently
+        analyses = self.analyze_players(roster_players, "Analyzing roster")
+        player_analyses = {a.player_name: a for a in analyses if a.fantasy_projection}
         
         # Group by position
-        players_by_position = {}
-        for player_name, analysis in player_analyses.items():
-            position = analysis.position
-            if position not in players_by_position:
-                players_by_position[position] = []
-            players_by_position[position].append(analysis)
+        players_by_position = defaultdict(list)
+        for analysis in player_analyses.values():
+            players_by_position[analysis.position].append(analysis)
+        players_by_position = dict(players_by_position)
         
         # Sort each position by projected points
         for position in players_by_position:
@@ -504,27 +943,234 @@ class FantasyEdgeAnalyzer:
             )
         
         # Build optimal lineup
-        optimal_lineup = {}
-        total_projected_points = 0
-        
-        for position, required_count in lineup_requirements.items():
-            if position in players_by_position:
-                selected = players_by_position[position][:required_count]
-                optimal_lineup[position] = selected
-                total_projected_points += sum(
-                    p.fantasy_projection.projected_points if p.fantasy_projection else 0
-                    for p in selected
-                )
+        candidates = self._prune_dominated(players_by_position, lineup_requirements, flex_spots)
+        optimal_lineup, flex = self._select_lineup(candidates, lineup_requirements, flex_spots, salary_cap)
+        starters = [p for players in optimal_lineup.values() for p in players] + flex
+        total_projected_points = sum(p.fantasy_projection.projected_points for p in starters)
+        started = {id(p) for p in starters}
         
-        return {
+        result = {
             'optimal_lineup': {pos.value: [p.player_name for p in players] 
                              for pos, players in optimal_lineup.items()},
             'total_projected_points': total_projected_points,
             'lineup_details': {pos.value: [p.to_dict() for p in players] 
                              for pos, players in optimal_lineup.items()},
-            'bench_players': {pos.value: [p.player_name for p in players[lineup_requirements.get(pos, 0):]] 
+            'bench_players': {pos.value: [p.player_name for p in players if id(p) not in started] 
                             for pos, players in players_by_position.items() if pos in lineup_requirements}
         }
+        if flex_spots:
+            result['optimal_lineup']['FLEX'] = [p.player_name for p in flex]
+            result['lineup_details']['FLEX'] = [p.to_dict() for p in flex]
+        if salary_cap is not None:
+            result['total_salary'] = sum(self._salary_of(p) for p in starters)
+        return result
+    
+    @staticmethod
+    def _salary_of(player: PlayerProps) -> int:
+        """DFS salary of a player, 0 when unknown"""
+        if player.roster_info and player.roster_info.salary:
+            return int(player.roster_info.salary)
+        return 0
+    
+    def _prune_dominated(self, players_by_position: Dict[Position, List[PlayerProps]],
+                         lineup_requirements: Dict[Position, int],
+                         flex_spots: int) -> Dict[Position, List[PlayerProps]]:
+        """
+        Drop players who can never start in an optimal lineup.
+        
+        A player is dominated by a same-position player with at least as many
+        projected points and no higher salary. If a position can fill k slots
+        (its own plus FLEX) and k other players dominate someone, one of them is
+        always free to take that player's place, so they can be skipped.
+        
+        Args:
+            players_by_position: Players per position, sorted by projected points
+        """
+        pruned = {}
+        for position, players in players_by_position.items():
+            slots = lineup_requirements.get(position, 0)
+            if position in self.FLEX_POSITIONS:
+                slots += flex_spots
+            
+            kept = []
+            kept_salaries = []  # Sorted, for counting dominators with bisect
+            for player in players:
+                salary = self._salary_of(player)
+                # Everyone kept so far has at least as many points
+                if bisect.bisect_right(kept_salaries, salary) >= slots:
+                    continue
+                kept.append(player)
+                bisect.insort(kept_salaries, salary)
+            pruned[position] = kept
+        
+        return pruned
+    
+    def _select_lineup(self, players_by_position: Dict[Position, List[PlayerProps]],
+                       lineup_requirements: Dict[Position, int], flex_spots: int,
+                       salary_cap: Optional[int]) -> Tuple[Dict[Position, List[PlayerProps]], List[PlayerProps]]:
+        """
+        Pick starters for the fixed slots and FLEX slots.
+        
+        Without a salary cap the best players per position are always optimal,
+        with FLEX taking the best leftovers. With a cap this becomes a knapsack
+        over (slots filled, salary used), solved exactly by DP.
+        
+        Returns:
+            Tuple of (starters by position, FLEX starters), each sorted by projected points
+        """
+        if salary_cap is None:
+            optimal_lineup = {pos: players_by_position[pos][:count]
+                              for pos, count in lineup_requirements.items() if pos in players_by_position}
+            leftovers = [p for pos in self.FLEX_POSITIONS if pos in players_by_position
+                         for p in players_by_position[pos][lineup_requirements.get(pos, 0):]]
+            leftovers.sort(key=lambda p: p.fantasy_projection.projected_points, reverse=True)
+            return optimal_lineup, leftovers[:flex_spots]
+        
+        # Slot kinds: one per required position, plus FLEX as the last kind
+        slot_positions = [pos for pos, count in lineup_requirements.items() if count > 0]
+        capacities = [lineup_requirements[pos] for pos in slot_positions]
+        flex_kind = None
+        if flex_spots > 0:
+            flex_kind = len(slot_positions)
+            capacities.append(flex_spots)
+        
+        candidates = [p for pos, players in players_by_position.items()
+                      if pos in slot_positions or (flex_kind is not None and pos in self.FLEX_POSITIONS)
+                      for p in players]
+        values = np.array([p.fantasy_projection.projected_points for p in candidates], dtype=float)
+        salaries = [self._salary_of(p) for p in candidates]
+        
+        # Enumerate slot-fill states; dp[s, c] is the best value with fill
+        # state s and total salary <= c
+        states = list(itertools.product(*(range(n + 1) for n in capacities)))
+        state_id = {state: i for i, state in enumerate(states)}
+        transitions = []  # per kind: (source states, destination states)
+        for kind in range(len(capacities)):
+            src = [i for i, state in enumerate(states) if state[kind] < capacities[kind]]
+            dst = [state_id[states[i][:kind] + (states[i][kind] + 1,) + states[i][kind + 1:]] for i in src]
+            transitions.append((np.array(src, dtype=np.intp), np.array(dst, dtype=np.intp)))
+        
+        # Scale salaries by their common divisor to keep the capacity axis short.
+        # If the table would still be too large (salaries with no round divisor),
+        # use a coarser unit and round salaries up so lineups stay under the cap
+        max_capacity = self.MAX_LINEUP_DP_CELLS // len(states) - 1
+        if max_capacity < 1:
+            raise ValueError(f"Lineup has too many slot combinations ({len(states)}) to optimize under a salary cap")
+        unit = math.gcd(salary_cap, *salaries) or 1
+        capacity = max(salary_cap, 0) // unit
+        if capacity > max_capacity:
+            unit *= math.ceil(capacity / max_capacity)
+            capacity = max(salary_cap, 0) // unit
+            logger.info("Rounding salaries up to multiples of %d to bound the lineup DP", unit)
+        weights = [-(-s // unit) for s in salaries]
+        
+        dp = np.full((len(states), capacity + 1), -np.inf)
+        dp[state_id[(0,) * len(capacities)]] = 0.0
+        # Per player: (kind, packed bits of the (state, capacity) cells where
+        # taking the player into that kind improved dp); sources are rebuilt
+        # from the state on the way back
+        taken = []
+        n_kinds = len(capacities)
+        for i, player in enumerate(candidates):
+            w = weights[i]
+            new_dp = dp.copy()
+            player_taken = []
+            if w <= capacity:
+                kinds = []
+                if player.position in slot_positions:
+                    kinds.append(slot_positions.index(player.position))
+                if flex_kind is not None and player.position in self.FLEX_POSITIONS:
+                    kinds.append(flex_kind)
+                for kind in kinds:
+                    src, dst = transitions[kind]
+                    if not len(src):
+                        continue
+                    candidate = dp[src, :capacity + 1 - w] + values[i]
+                    current = new_dp[dst, w:]
+                    better = candidate > current
+                    new_dp[dst, w:] = np.where(better, candidate, current)
+                    improved = np.zeros(dp.shape, dtype=bool)
+                    improved[dst, w:] = better
+                    player_taken.append((kind, np.packbits(improved, axis=None)))
+            taken.append(player_taken)
+            dp = new_dp
+        
+        # Walk the choices back from the best of the most-filled reachable states;
+        # leaving a slot empty to afford a star would otherwise look better than
+        # a complete lineup
+        filled = np.array([sum(state) for state in states])
+        reachable = np.isfinite(dp[:, capacity])
+        most_filled = filled == (filled[reachable].max() if reachable.any() else 0)
+        state = int(np.argmax(np.where(most_filled, dp[:, capacity], -np.inf)))
+        remaining = capacity
+        picked = {kind: [] for kind in range(n_kinds)}
+        if np.isfinite(dp[state, remaining]):
+            for i in range(len(candidates) - 1, -1, -1):
+                # A later kind's improvement overrides an earlier one for the same cell
+                cell = state * (capacity + 1) + remaining
+                for kind, bits in reversed(taken[i]):
+                    if bits[cell >> 3] >> (7 - (cell & 7)) & 1:
+                        picked[kind].append(candidates[i])
+                        fill = states[state]
+                        state = state_id[fill[:kind] + (fill[kind] - 1,) + fill[kind + 1:]]
+                        remaining -= weights[i]
+                        break
+        
+        def by_points(players: List[PlayerProps]) -> List[PlayerProps]:
+            return sorted(players, key=lambda p: p.fantasy_projection.projected_points, reverse=True)
+        
+        optimal_lineup = {pos: by_points(picked[kind]) for kind, pos in enumerate(slot_positions)
+                          if pos in players_by_position}
+        flex = by_points(picked[flex_kind]) if flex_kind is not None else []
+        return optimal_lineup, flex
+    
+    def prefetch_players(self, player_names: List[str]):
+        """
+        Fetch props for every game these players appear in, concurrently and into
+        the cache, so later analyses of any of them don't wait on the API.
+        
+        Args:
+            player_names: Every player the caller is about to analyze
+        """
+        if self.api_key or self.offline:
+            self._get_all_event_props(self._games_for_players(list(dict.fromkeys(player_names))))
+    
+    def analyze_players(self, player_names: List[str], description: str = "Analyzing players") -> List[PlayerProps]:
+        """
+        Analyze many players concurrently and project them in one batch.
+        
+        Args:
+            player_names: Names of the NFL players
+            description: Label for the progress bar
+            
+        Returns:
+            PlayerProps for every player that could be analyzed, in input order
+        """
+        # Fetch each game's props once up front so concurrent player lookups share them
+        self.prefetch_players(player_names)
+        
+        results = {}
+        progress = ProgressBar(len(player_names), description)
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self._collect_player_props, player_name, quiet=True): player_name
+                for player_name in player_names
+            }
+            for future in as_completed(futures):
+                progress.update()
+                player_name = futures[future]
+                try:
+                    results[player_name] = future.result()
+                except (ValueError, KeyError, requests.RequestException) as e:
+                    logger.warning("Could not analyze %s: %s", player_name, e)
+                    continue
+        
+        # Project everyone at once, keeping input order so ties resolve the
+        # same way regardless of completion order
+        analyses = [results[name] for name in player_names if name in results]
+        self._project_batch(analyses)
+        return analyses
     
     def _generate_fantasy_projection(self, player_name: str, position: Optional[Position], 
                                    betting_lines: List[BettingLine]) -> Optional[FantasyProjection]:
@@ -534,23 +1180,15 @@ class FantasyEdgeAnalyzer:
         if not betting_lines or not position:
             return None
         
-        # Get consensus lines (average across bookmakers for each prop)
-        consensus_lines = self._get_consensus_lines(betting_lines)
-        
-        projected_points = 0.0
-        breakdown = {}
-        confidence_scores = []
-        
-        # Convert each prop to fantasy points based on position
-        if position == Position.QB:
-            projected_points, breakdown, confidence_scores = self._project_qb_points(consensus_lines)
-        elif position == Position.RB:
-            projected_points, breakdown, confidence_scores = self._project_rb_points(consensus_lines)
-        elif position == Position.WR:
-            projected_points, breakdown, confidence_scores = self._project_wr_points(consensus_lines)
-        elif position == Position.TE:
-            projected_points, breakdown, confidence_scores = self._project_te_points(consensus_lines)
+        # Get consensus lines (average across bookmakers for each prop) and project them
+        lines, present = self._consensus_matrix([betting_lines])
+        [(projected_points, breakdown, confidence_scores)] = self._project_rows(position, lines, present)
         
+        return self._build_projection(player_name, position, projected_points, breakdown, confidence_scores)
+    
+    def _build_projection(self, player_name: str, position: Position, projected_points: float,
+                          breakdown: Dict[str, float], confidence_scores: List[float]) -> FantasyProjection:
+        """Assemble a FantasyProjection from projected points and per-prop confidences"""
         # Calculate overall confidence (average of individual prop confidences)
         overall_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.5
         
@@ -562,132 +1200,87 @@ class FantasyEdgeAnalyzer:
             breakdown=breakdown
         )
     
+    def _project_batch(self, analyses: List[PlayerProps]):
+        """
+        Fill in fantasy projections for many players at once, with a single
+        (players × props) @ (props,) product per position.
+        """
+        projectable = [a for a in analyses if a.betting_lines and a.position]
+        if not projectable:
+            return
+        
+        lines, present = self._consensus_matrix([a.betting_lines for a in projectable])
+        self._apply_projections(projectable, lines, present)
+    
+    def _apply_projections(self, analyses: List[PlayerProps], lines: np.ndarray, present: np.ndarray):
+        """Project each player from their row of the consensus matrix"""
+        rows_by_position = defaultdict(list)
+        for row, analysis in enumerate(analyses):
+            rows_by_position[analysis.position].append(row)
+        
+        for position, rows in rows_by_position.items():
+            projections = self._project_rows(position, lines[rows], present[rows])
+            for row, (points, breakdown, confidence_scores) in zip(rows, projections):
+                analysis = analyses[row]
+                analysis.fantasy_projection = self._build_projection(
+                    analysis.player_name, position, points, breakdown, confidence_scores
+                )
+    
+    def _consensus_matrix(self, players_lines: List[List[BettingLine]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stack each player's consensus lines into a (players × props) matrix,
+        plus a mask of which props each player actually has lines for.
+        """
+        lines = np.zeros((len(players_lines), len(_PROP_ORDER)))
+        present = np.zeros(lines.shape, dtype=bool)
+        
+        for row, betting_lines in enumerate(players_lines):
+            for prop, line in self._get_consensus_lines(betting_lines).items():
+                lines[row, _PROP_ID[prop]] = line
+                present[row, _PROP_ID[prop]] = True
+        
+        return lines, present
+    
     def _get_consensus_lines(self, betting_lines: List[BettingLine]) -> Dict[str, float]:
         """Get consensus lines by averaging across bookmakers for each prop type"""
-        prop_lines = {}
-        
-        for line in betting_lines:
-            if line.prop_type not in prop_lines:
-                prop_lines[line.prop_type] = []
-            prop_lines[line.prop_type].append(line.line)
-        
-        # Return average line for each prop
-        return {prop: sum(lines) / len(lines) for prop, lines in prop_lines.items()}
-    
-    def _project_qb_points(self, consensus_lines: Dict[str, float]) -> Tuple[float, Dict[str, float], List[float]]:
-        """Project fantasy points for QB position"""
-        points = 0.0
-        breakdown = {}
-        confidence_scores = []
-        
-        # Passing yards
-        if PropType.PASS_YARDS.value in consensus_lines:
-            yards = consensus_lines[PropType.PASS_YARDS.value]
-            yard_points = yards / self.scoring.pass_yards_per_point
-            points += yard_points
-            breakdown['passing_yards'] = yard_points
-            confidence_scores.append(0.8)  # High confidence for yards props
-        
-        # Passing TDs
-        if PropType.PASS_TDS.value in consensus_lines:
-            tds = consensus_lines[PropType.PASS_TDS.value]
-            td_points = tds * self.scoring.pass_td_points
-            points += td_points
-            breakdown['passing_tds'] = td_points
-            confidence_scores.append(0.7)
-        
-        # Rushing yards (for mobile QBs)
-        if PropType.RUSH_YARDS.value in consensus_lines:
-            rush_yards = consensus_lines[PropType.RUSH_YARDS.value]
-            rush_points = rush_yards / self.scoring.rush_yards_per_point
-            points += rush_points
-            breakdown['rushing_yards'] = rush_points
-            confidence_scores.append(0.6)
-        
-        # Rushing TDs
-        if PropType.RUSH_TDS.value in consensus_lines:
-            rush_tds = consensus_lines[PropType.RUSH_TDS.value]
-            rush_td_points = rush_tds * self.scoring.rush_td_points
-            points += rush_td_points
-            breakdown['rushing_tds'] = rush_td_points
-            confidence_scores.append(0.5)
-        
-        return points, breakdown, confidence_scores
-    
-    def _project_rb_points(self, consensus_lines: Dict[str, float]) -> Tuple[float, Dict[str, float], List[float]]:
-        """Project fantasy points for RB position"""
-        points = 0.0
-        breakdown = {}
-        confidence_scores = []
-        
-        # Rushing yards
-        if PropType.RUSH_YARDS.value in consensus_lines:
-            yards = consensus_lines[PropType.RUSH_YARDS.value]
-            yard_points = yards / self.scoring.rush_yards_per_point
-            points += yard_points
-            breakdown['rushing_yards'] = yard_points
-            confidence_scores.append(0.8)
-        
-        # Rushing TDs
-        if PropType.RUSH_TDS.value in consensus_lines:
-            tds = consensus_lines[PropType.RUSH_TDS.value]
-            td_points = tds * self.scoring.rush_td_points
-            points += td_points
-            breakdown['rushing_tds'] = td_points
-            confidence_scores.append(0.6)
-        
-        # Receiving (for pass-catching RBs)
-        if PropType.RECEPTIONS.value in consensus_lines:
-            receptions = consensus_lines[PropType.RECEPTIONS.value]
-            rec_points = receptions * self.scoring.reception_points
-            points += rec_points
-            breakdown['receptions'] = rec_points
-            confidence_scores.append(0.7)
-        
-        if PropType.RECEIVING_YARDS.value in consensus_lines:
-            rec_yards = consensus_lines[PropType.RECEIVING_YARDS.value]
-            rec_yard_points = rec_yards / self.scoring.receiving_yards_per_point
-            points += rec_yard_points
-            breakdown['receiving_yards'] = rec_yard_points
-            confidence_scores.append(0.7)
-        
-        return points, breakdown, confidence_scores
-    
-    def _project_wr_points(self, consensus_lines: Dict[str, float]) -> Tuple[float, Dict[str, float], List[float]]:
-        """Project fantasy points for WR position"""
-        points = 0.0
-        breakdown = {}
-        confidence_scores = []
-        
-        # Receptions
-        if PropType.RECEPTIONS.value in consensus_lines:
-            receptions = consensus_lines[PropType.RECEPTIONS.value]
-            rec_points = receptions * self.scoring.reception_points
-            points += rec_points
-            breakdown['receptions'] = rec_points
-            confidence_scores.append(0.8)
-        
-        # Receiving yards
-        if PropType.RECEIVING_YARDS.value in consensus_lines:
-            yards = consensus_lines[PropType.RECEIVING_YARDS.value]
-            yard_points = yards / self.scoring.receiving_yards_per_point
-            points += yard_points
-            breakdown['receiving_yards'] = yard_points
-            confidence_scores.append(0.8)
-        
-        # Receiving TDs
-        if PropType.RECEIVING_TDS.value in consensus_lines:
-            tds = consensus_lines[PropType.RECEIVING_TDS.value]
-            td_points = tds * self.scoring.receiving_td_points
-            points += td_points
-            breakdown['receiving_tds'] = td_points
-            confidence_scores.append(0.6)
-        
-        return points, breakdown, confidence_scores
-    
-    def _project_te_points(self, consensus_lines: Dict[str, float]) -> Tuple[float, Dict[str, float], List[float]]:
-        """Project fantasy points for TE position (same as WR for most leagues)"""
-        return self._project_wr_points(consensus_lines)
+        count = len(betting_lines)
+        prop_ids = np.fromiter((_PROP_ID.get(line.prop_type, -1) for line in betting_lines),
+                               dtype=np.int32, count=count)
+        values = np.fromiter((line.line for line in betting_lines), dtype=np.float64, count=count)
+        
+        # Markets outside PropType never feed a projection, so drop them
+        known = prop_ids >= 0
+        prop_ids, values = prop_ids[known], values[known]
+        
+        # Sum and count every prop type in one pass, then average
+        sums = np.bincount(prop_ids, weights=values, minlength=len(_PROP_ORDER))
+        counts = np.bincount(prop_ids, minlength=len(_PROP_ORDER))
+        
+        return {_PROP_ORDER[i]: float(sums[i] / counts[i]) for i in np.flatnonzero(counts)}
+    
+    def _project_rows(self, position: Position, lines: np.ndarray,
+                      present: np.ndarray) -> List[Tuple[float, Dict[str, float], List[float]]]:
+        """Project fantasy points for rows of consensus lines belonging to one position"""
+        pos_idx = _POS_ID.get(position)
+        if pos_idx is None:
+            return [(0.0, {}, []) for _ in range(len(lines))]  # No prop-based projection for K/DST yet
+        
+        coef = self._coef[pos_idx]
+        columns = _POSITION_COLUMNS[position]
+        points = lines @ coef
+        contributions = lines * coef
+        
+        results = []
+        for row in range(len(lines)):
+            breakdown = {}
+            confidence_scores = []
+            for prop_id, label, confidence in columns:
+                if present[row, prop_id]:
+                    breakdown[label] = float(contributions[row, prop_id])
+                    confidence_scores.append(confidence)
+            results.append((float(points[row]), breakdown, confidence_scores))
+        
+        return results
     
     def get_all_players_in_game(self, home_team: str, away_team: str) -> List[PlayerProps]:
         """
@@ -703,46 +1296,21 @@ class FantasyEdgeAnalyzer:
         games = self._get_nfl_games()
         
         # Find the specific game
-        target_game = None
-        for game in games:
-            if (self._normalize_team_name(game['home_team']) == self._normalize_team_name(home_team) and
-                self._normalize_team_name(game['away_team']) == self._normalize_team_name(away_team)):
-                target_game = game
-                break
+        _, game_by_matchup = self._index_games(games)
+        target_game = game_by_matchup.get((_normalize_team(home_team), _normalize_team(away_team)))
         
         if not target_game:
             raise ValueError(f"Game not found: {away_team} @ {home_team}")
         
-        # Get all props for this game
-        event_props = self._get_event_props(target_game['id'])
-        
-        # Organize by player
-        players_dict = {}
-        for bookmaker_data in event_props:
-            for market in bookmaker_data.get('markets', []):
-                for outcome in market.get('outcomes', []):
-                    player_name = outcome.get('description', '')
-                    if player_name and player_name != '':
-                        if player_name not in players_dict:
-                            players_dict[player_name] = []
-                        
-                        line = BettingLine(
-                            player_name=player_name,
-                            prop_type=market['key'],
-                            line=outcome.get('point', 0),
-                            over_odds=outcome.get('price') if outcome.get('name') == 'Over' else None,
-                            under_odds=outcome.get('price') if outcome.get('name') == 'Under' else None,
-                            bookmaker=bookmaker_data['title'],
-                            last_update=datetime.fromisoformat(market['last_update'].replace('Z', '+00:00'))
-                        )
-                        players_dict[player_name].append(line)
+        # Get all props for this game, one row per line
+        frame = self._lines_frame(self._get_event_props(target_game['id']))
         
         # Convert to PlayerProps list with fantasy analysis
         result = []
-        game_time = datetime.fromisoformat(target_game['commence_time'].replace('Z', '+00:00'))
+        game_time = _parse_ts(target_game['commence_time'])
         
-        for player_name, betting_lines in players_dict.items():
-            position = self.position_map.get(player_name)
+        for player_name, player_frame in frame.groupby('player_name', sort=False):
+            position = self._lookup_position(player_name)
             player_team = self._determine_player_team(target_game, player_name)
             
             roster_info = PlayerRosterInfo(
@@ -753,29 +1321,216 @@ class FantasyEdgeAnalyzer:
                 game_time=game_time
             )
             
-            fantasy_projection = self._generate_fantasy_projection(player_name, position, betting_lines)
-            
             result.append(PlayerProps(
                 player_name=player_name,
                 position=position,
                 roster_info=roster_info,
-                betting_lines=betting_lines,
-                fantasy_projection=fantasy_projection
+                betting_lines=self._frame_to_betting_lines(player_frame),
+                fantasy_projection=None
             ))
         
+        # Consensus lines for every player come from one groupby over the frame
+        projectable = [p for p in result if p.position]
+        lines, present = self._consensus_frame(frame, [p.player_name for p in projectable])
+        self._apply_projections(projectable, lines, present)
+        
         return result
     
-    def _get_nfl_games(self) -> List[Dict]:
-        """Fetch current NFL games from The Odds API"""
-        cache_key = "nfl_games"
+    def _lines_frame(self, event_props: List[Dict]) -> 'pd.DataFrame':
+        """Flatten an event's props into a table with one row per outcome"""
+        import pandas as pd
         
-        # Check cache
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if time.time() - cached_time < self._cache_timeout:
-                return cached_data
+        names, props, points, overs, unders, books, updates = [], [], [], [], [], [], []
         
-        print("📊 Fetching NFL games...")
+        for bookmaker_data in event_props:
+            for market in bookmaker_data.get('markets', []):
+                outcomes = market.get('outcomes', [])
+                if not outcomes:
+                    continue
+                last_update = _parse_ts(market['last_update'])
+                
+                for outcome in outcomes:
+                    player_name = outcome.get('description', '')
+                    if not player_name:
+                        continue
+                    side = outcome.get('name')
+                    names.append(player_name)
+                    props.append(market['key'])
+                    points.append(outcome.get('point', 0))
+                    overs.append(outcome.get('price') if side == 'Over' else None)
+                    unders.append(outcome.get('price') if side == 'Under' else None)
+                    books.append(bookmaker_data['title'])
+                    updates.append(last_update)
+        
+        return pd.DataFrame({
+            'player_name': pd.Series(names, dtype=object),
+            'prop_type': pd.Series(props, dtype=object),
+            'line': pd.Series(points, dtype=float),
+            # Object columns keep missing odds as None rather than NaN
+            'over_odds': pd.Series(overs, dtype=object),
+            'under_odds': pd.Series(unders, dtype=object),
+            'bookmaker': pd.Series(books, dtype=object),
+            'last_update': pd.Series(updates, dtype=object),
+        })
+    
+    def _frame_to_betting_lines(self, frame: 'pd.DataFrame') -> List[BettingLine]:
+        """Convert rows of a lines frame back into BettingLine objects"""
+        columns = ['player_name', 'prop_type', 'line', 'over_odds', 'under_odds', 'bookmaker', 'last_update']
+        return [BettingLine(*row) for row in frame[columns].itertuples(index=False, name=None)]
+    
+    def _consensus_frame(self, frame: 'pd.DataFrame', player_names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same as _consensus_matrix, but averaging a lines frame with one groupby
+        for all players at once.
+        """
+        lines = np.zeros((len(player_names), len(_PROP_ORDER)))
+        present = np.zeros(lines.shape, dtype=bool)
+        
+        row_of = {name: row for row, name in enumerate(player_names)}
+        known = frame[frame['prop_type'].isin(_PROP_ID) & frame['player_name'].isin(row_of)]
+        if known.empty:
+            return lines, present
+        
+        means = known.groupby(['player_name', 'prop_type'], sort=False)['line'].mean()
+        rows = [row_of[name] for name in means.index.get_level_values(0)]
+        cols = [_PROP_ID[prop] for prop in means.index.get_level_values(1)]
+        lines[rows, cols] = means.to_numpy()
+        present[rows, cols] = True
+        
+        return lines, present
+    
+    def _cache_key(self, endpoint: str, *params: Any) -> str:
+        """Build a filesystem-safe cache key from an endpoint name and its parameters"""
+        digest = hashlib.md5(repr(params).encode()).hexdigest()
+        return f"{endpoint}_{digest}"
+    
+    def _get_cached(self, cache_key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Look up a response in the in-memory cache, falling back to disk.
+        
+        Returns:
+            Tuple of (payload, is_fresh). Expired payloads are still returned so
+            callers can serve them while a refresh happens in the background.
+        """
+        cached_data = self._cache.get(cache_key)
+        if cached_data is not None:
+            return cached_data, True
+        
+        entry = self._file_cache.get_entry(cache_key)
+        if entry is not None:
+            remaining = entry['ttl'] - (time.time() - entry['ts'])
+            if remaining > 0:
+                self._cache.set(cache_key, entry['payload'], min(remaining, self._cache_timeout))
+                return entry['payload'], True
+            return entry['payload'], False
+        
+        return None, False
+    
+    def _set_cached(self, cache_key: str, data: Any, ttl: float):
+        """Store a response in both the in-memory and on-disk caches"""
+        self._cache.set(cache_key, data, min(ttl, self._cache_timeout))
+        self._file_cache.set(cache_key, data, ttl)
+    
+    def _cached_fetch(self, cache_key: str, fetcher: Callable[[], Optional[Any]],
+                      ttl: Callable[[], float], default: Any, force_fresh: bool = False) -> Any:
+        """
+        Serve a response from cache, refreshing stale entries without blocking.
+        
+        Args:
+            cache_key: Key for the response in the cache
+            fetcher: Performs the API request; returns None on failure
+            ttl: Returns the TTL to store a fresh response with
+            default: Value returned when nothing is cached and the fetch fails
+            force_fresh: Never serve a stale entry; wait for the API instead
+        """
+        cached_data, is_fresh = self._get_cached(cache_key)
+        if is_fresh:
+            return cached_data
+        
+        if self.offline:
+            # Replaying a saved slate: any cached copy will do
+            return cached_data if cached_data is not None else default
+        
+        if cached_data is not None and not force_fresh:
+            # Serve the stale payload now and refresh it in the background
+            with self._cache_lock:
+                start_refresh = cache_key not in self._in_flight
+                self._in_flight.add(cache_key)
+            if start_refresh:
+                threading.Thread(
+                    target=self._refresh, args=(cache_key, fetcher, ttl), daemon=True
+                ).start()
+            return cached_data
+        
+        return self._fetch_once(cache_key, fetcher, ttl, default)
+    
+    def _fetch_once(self, cache_key: str, fetcher: Callable[[], Optional[Any]],
+                    ttl: Callable[[], float], default: Any) -> Any:
+        """Fetch and cache a response, sharing one request among concurrent callers"""
+        with self._cache_lock:
+            pending = self._pending.get(cache_key)
+            if pending is None:
+                # The previous fetch may have finished since our cache check
+                cached_data = self._cache.get(cache_key)
+                if cached_data is not None:
+                    return cached_data
+                pending = self._pending[cache_key] = Future()
+                is_owner = True
+            else:
+                is_owner = False
+        
+        if not is_owner:
+            return pending.result()
+        
+        try:
+            data = fetcher()
+            if data is None:
+                data = default
+            else:
+                self._set_cached(cache_key, data, ttl())
+            pending.set_result(data)
+            return data
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._cache_lock:
+                del self._pending[cache_key]
+    
+    def _refresh(self, cache_key: str, fetcher: Callable[[], Optional[Any]], ttl: Callable[[], float]):
+        """Re-fetch a stale cache entry (runs on a background thread)"""
+        try:
+            data = fetcher()
+            if data is not None:
+                self._set_cached(cache_key, data, ttl())
+        except Exception as e:
+            logger.warning("Background refresh failed for %s: %s", cache_key, e)
+        finally:
+            with self._cache_lock:
+                self._in_flight.discard(cache_key)
+    
+    def _hours_to_kickoff(self, event_id: str) -> Optional[float]:
+        """Hours until the event starts, if the games list is already cached"""
+        games = self._cache.get(self._cache_key("nfl_games"), [])
+        
+        for game in games:
+            if game['id'] == event_id:
+                kickoff = _parse_ts(game['commence_time'])
+                return (kickoff.timestamp() - time.time()) / 3600
+        
+        return None
+    
+    def _event_props_ttl(self, event_id: str) -> float:
+        """Pick the props TTL based on how close the event is to kickoff"""
+        hours_to_kickoff = self._hours_to_kickoff(event_id)
+        if hours_to_kickoff is not None and hours_to_kickoff > self.GAME_WINDOW_HOURS:
+            return self.EVENT_PROPS_IDLE_TTL
+        return self.EVENT_PROPS_TTL
+    
+    @cached_response(key=lambda self: self._cache_key("nfl_games"), ttl=lambda self: self.GAMES_TTL)
+    def _get_nfl_games(self) -> Optional[List[Dict]]:
+        """Fetch current NFL games from The Odds API"""
+        self._say("📊 Fetching NFL games...")
         
         url = f"{self.ODDS_API_BASE}/sports/americanfootball_nfl/events"
         params = {
@@ -783,144 +1538,258 @@ class FantasyEdgeAnalyzer:
             'dateFormat': 'iso'
         }
         
-        response = self.session.get(url, params=params)
+        response = self._request_with_retry(url, params)
         
         if response.status_code != 200:
-            print(f"❌ Failed to fetch games: {response.status_code}")
-            return []
+            self._say(f"❌ Failed to fetch games: {response.status_code}")
+            return None
             
         response.raise_for_status()
         
-        games = response.json()
-        print(f"✅ Found {len(games)} games")
+        try:
+            games = _json_loads(response.content)
+        except ValueError as e:
+            self._say(f"❌ JSON decode error: {e}")
+            return None  # Don't cache a truncated body
         
-        # Cache the result
-        self._cache[cache_key] = (time.time(), games)
+        self._say(f"✅ Found {len(games)} games")
         
         return games
     
-    def _get_event_props(self, event_id: str, prop_types: Optional[List[PropType]] = None) -> List[Dict]:
+    def _get_event_props(self, event_id: str, prop_types: Optional[List[PropType]] = None,
+                         force_fresh: bool = False) -> List[Dict]:
         """Fetch player props for a specific event/game"""
-        cache_key = f"event_{event_id}"
-        
-        # Check cache
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if time.time() - cached_time < self._cache_timeout:
-                return cached_data
-        
         # Build markets parameter
         if prop_types:
             markets = ','.join([pt.value for pt in prop_types])
         else:
             # Get all common prop markets - only use valid ones
-            markets = ','.join([
-                PropType.PASS_TDS.value,
-                PropType.PASS_YARDS.value,
-                PropType.PASS_COMPLETIONS.value,
-                PropType.PASS_ATTEMPTS.value,
-                PropType.RUSH_YARDS.value,
-                PropType.RUSH_TDS.value,
-                PropType.RUSH_ATTEMPTS.value,
-                PropType.RECEIVING_YARDS.value,
-                PropType.RECEIVING_TDS.value,
-                PropType.RECEPTIONS.value,
-                PropType.ANYTIME_TD.value,
-                PropType.FIRST_TD.value
-            ])
+            markets = _DEFAULT_MARKETS
+        
+        # Lines are about to lock, so don't risk serving a stale copy
+        hours_to_kickoff = self._hours_to_kickoff(event_id)
+        if hours_to_kickoff is not None and hours_to_kickoff * 60 < self.FRESH_REQUIRED_MINUTES:
+            force_fresh = True
+        
+        return self._get_market_props(event_id, markets, force_fresh=force_fresh)
+    
+    def _get_all_event_props(self, event_ids: List[str],
+                             prop_types: Optional[List[PropType]] = None) -> Dict[str, List[Dict]]:
+        """
+        Fetch player props for many events, keyed by event id.
+        
+        The Odds API only serves player-prop markets from the per-event endpoint
+        (the bulk odds endpoint carries featured markets only), so this fans the
+        per-event requests out over the worker pool, each through the cache.
+        Events whose request fails are left out.
+        """
+        event_props = {}
+        futures = {
+            self._fetch_pool.submit(self._get_event_props, event_id, prop_types): event_id
+            for event_id in dict.fromkeys(event_ids)
+        }
+        for future in as_completed(futures):
+            try:
+                event_props[futures[future]] = future.result()
+            except requests.RequestException as e:
+                logger.debug("Could not fetch props for %s: %s", futures[future], e)
+        return event_props
+    
+    def _games_for_players(self, player_names: List[str]) -> List[str]:
+        """
+        Event ids whose props are needed to find these players: just their teams'
+        games when every team is known, otherwise every game this week.
+        """
+        games = self._get_nfl_games()
+        game_by_team, _ = self._index_games(games)
         
+        event_ids = []
+        for player_name in player_names:
+            team = self._lookup_team(player_name)
+            game = game_by_team.get(self._normalize_team_name(team)) if team else None
+            if game is None:
+                return [game['id'] for game in games]
+            event_ids.append(game['id'])
+        
+        return event_ids
+    
+    def _request_with_retry(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        """
+        GET a URL, retrying rate limits and transient server errors with
+        exponential backoff and jitter. The last response is returned either way.
+        
+        Requests from every thread share MAX_CONCURRENT_REQUESTS slots (nested
+        pools would otherwise multiply), and a slot is released while backing
+        off so one rate-limited worker doesn't hold up the others.
+        """
+        for attempt in range(self.MAX_RETRIES - 1):
+            with self._request_slots:
+                response = self.session.get(url, params=params)
+            if response.status_code not in self.RETRY_STATUSES:
+                return response
+            
+            delay = self._retry_delay(response, attempt)
+            reason = "Rate limited" if response.status_code == 429 else f"Server error {response.status_code}"
+            logger.info("%s, retrying in %.1f seconds", reason, delay)
+            time.sleep(delay)
+        
+        with self._request_slots:
+            return self.session.get(url, params=params)
+    
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before a retry, preferring the API's Retry-After header"""
+        try:
+            delay = float(response.headers.get('Retry-After', 0))
+        except ValueError:
+            delay = 0.0  # HTTP-date form; fall back to backoff
+        if delay <= 0:
+            delay = min(self.MAX_BACKOFF, 2 ** attempt)
+        
+        # Jitter so concurrent workers don't retry in lockstep
+        return delay + random.uniform(0, 0.5 * delay)
+    
+    @cached_response(
+        key=lambda self, event_id, markets: self._cache_key(
+            "event_props", event_id, sorted(markets.split(',')), self.bookmakers
+        ),
+        ttl=lambda self, event_id, markets: self._event_props_ttl(event_id)
+    )
+    def _get_market_props(self, event_id: str, markets: str) -> Optional[List[Dict]]:
+        """Fetch the given prop markets for an event from The Odds API"""
         url = f"{self.ODDS_API_BASE}/sports/americanfootball_nfl/events/{event_id}/odds"
         params = {
             'apiKey': self.api_key,
-            'bookmakers': ','.join(self.bookmakers),
+            'bookmakers': self._bookmakers_param,
             'markets': markets,
             'oddsFormat': 'american',
             'dateFormat': 'iso'
         }
         
-        response = self.session.get(url, params=params)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            print("\n⏳ Rate limited, waiting 2 seconds...")
-            time.sleep(2)
-            response = self.session.get(url, params=params)
+        response = self._request_with_retry(url, params)
         
         if response.status_code != 200:
-            print(f"\n❌ API Error {response.status_code}: {response.text}")
-            return []  # Return empty list instead of crashing
+            logger.warning("Odds API error %s for event %s: %s", response.status_code, event_id, response.text)
+            return None  # Don't cache failures
             
         try:
-            data = response.json()
-            bookmakers_data = data.get('bookmakers', [])
-        except requests.exceptions.JSONDecodeError as e:
-            print(f"\n❌ JSON decode error: {e}")
-            return []
+            data = _json_loads(response.content)
+            return data.get('bookmakers', [])
+        except ValueError as e:
+            logger.warning("Could not decode props for event %s: %s", event_id, e)
+            return None
         except Exception as e:
-            print(f"\n❌ Unexpected error: {e}")
-            return []
-        
-        # Cache the result
-        self._cache[cache_key] = (time.time(), bookmakers_data)
-        
-        return bookmakers_data
+            logger.warning("Unexpected error reading props for event %s: %s", event_id, e)
+            return None
     
     def _filter_player_props(self, bookmakers_data: List[Dict], player_name: str) -> List[BettingLine]:
         """Filter props data for a specific player"""
-        player_lines = []
+        index, names = self._event_props_index(bookmakers_data)
         player_name_lower = player_name.lower()
         
+        player_lines = index.get(player_name_lower)
+        if player_lines is not None:
+            return list(player_lines)
+        
+        # Most events don't have the player at all; one substring search over
+        # every name rules that out before scanning for partial matches
+        if player_name_lower not in names:
+            return []
+        
+        # Fall back to partial matches, e.g. just a last name
+        return [line for name, lines in index.items() if player_name_lower in name for line in lines]
+    
+    def _event_props_index(self, bookmakers_data: List[Dict]) -> Tuple[Dict[str, List[BettingLine]], str]:
+        """
+        Index an event's props by player, parsing each props payload only once.
+        
+        Returns:
+            Tuple of (lines by lowercased player name, all those names joined by newlines)
+        """
+        cached = self._props_index.get(id(bookmakers_data))
+        if cached is not None and cached[0] is bookmakers_data:
+            return cached[1], cached[2]
+        
+        index = self._index_event_props(bookmakers_data)
+        names = '\n'.join(index)
+        # Keep the payload alongside so its id can't be reused while cached
+        self._props_index.set(id(bookmakers_data), (bookmakers_data, index, names))
+        return index, names
+    
+    def _index_event_props(self, bookmakers_data: List[Dict]) -> Dict[str, List[BettingLine]]:
+        """Parse an event's props into BettingLines keyed by lowercased player name"""
+        index = defaultdict(list)
+        lowered = {}  # The same names repeat across every bookmaker and market
+        
         for bookmaker in bookmakers_data:
-            bookmaker_name = bookmaker.get('title', '')
+            # Interned so the thousands of lines per slate share one copy of each
+            bookmaker_name = sys.intern(bookmaker.get('title', ''))
             
             for market in bookmaker.get('markets', []):
-                market_key = market.get('key', '')
+                market_key = sys.intern(market.get('key', ''))
                 last_update = market.get('last_update', '')
+                market_last_update = _parse_ts(last_update) if last_update else datetime.now()
                 
-                # Group outcomes by player
-                player_outcomes = {}
+                # Over and Under arrive as separate outcomes; fill both into one
+                # BettingLine per player as they stream past
+                market_lines = {}
                 
                 for outcome in market.get('outcomes', []):
                     desc = outcome.get('description', '')
-                    if desc and player_name_lower in desc.lower():
-                        if desc not in player_outcomes:
-                            player_outcomes[desc] = {}
-                        
-                        if outcome.get('name') == 'Over':
-                            player_outcomes[desc]['over_odds'] = outcome.get('price')
-                            player_outcomes[desc]['line'] = outcome.get('point', 0)
-                        elif outcome.get('name') == 'Under':
-                            player_outcomes[desc]['under_odds'] = outcome.get('price')
-                            player_outcomes[desc]['line'] = outcome.get('point', 0)
-                
-                # Create BettingLine objects
-                for player, odds_data in player_outcomes.items():
-                    line = BettingLine(
-                        player_name=player,
-                        prop_type=market_key,
-                        line=odds_data.get('line', 0),
-                        over_odds=odds_data.get('over_odds'),
-                        under_odds=odds_data.get('under_odds'),
-                        bookmaker=bookmaker_name,
-                        last_update=datetime.fromisoformat(last_update.replace('Z', '+00:00')) if last_update else datetime.now()
-                    )
-                    player_lines.append(line)
-        
-        return player_lines
+                    if not desc:
+                        continue
+                    
+                    betting_line = market_lines.get(desc)
+                    if betting_line is None:
+                        key = lowered.get(desc)
+                        if key is None:
+                            key = lowered[desc] = desc.lower()
+                        # Positional, in field order, as this runs for every line of every event
+                        betting_line = market_lines[desc] = BettingLine(
+                            desc, market_key, 0, None, None, bookmaker_name, market_last_update
+                        )
+                        index[key].append(betting_line)
+                    
+                    side = outcome.get('name')
+                    if side == 'Over':
+                        betting_line.over_odds = outcome.get('price')
+                        betting_line.line = outcome.get('point', 0)
+                    elif side == 'Under':
+                        betting_line.under_odds = outcome.get('price')
+                        betting_line.line = outcome.get('point', 0)
+        
+        return dict(index)  # Plain dict so lookups for unknown players don't add keys
     
     def _normalize_team_name(self, team: str) -> str:
         """Normalize team names for comparison"""
-        return team.lower().replace(' ', '').replace('.', '')
+        return _normalize_team(team)
     
     def _determine_player_team(self, game: Dict, player_name: str) -> Optional[str]:
         """
         Try to determine which team a player belongs to.
         This is a simplified version - in production you'd want a player roster database.
         """
-        # This would ideally query a roster database
-        # For now, return None or implement roster lookup
+        team = self._lookup_team(player_name)
+        if team:
+            normalized = self._normalize_team_name(team)
+            for side in (game['home_team'], game['away_team']):
+                if self._normalize_team_name(side) == normalized:
+                    return side
         return None
     
+    def _index_games(self, games: List[Dict]) -> Tuple[Dict[str, Dict], Dict[Tuple[str, str], Dict]]:
+        """
+        Index games by normalized team name and by (home, away) matchup.
+        The indexes are rebuilt only when a different games list comes back.
+        """
+        indexed = self._games_index
+        if indexed is None or indexed[0] is not games:
+            game_by_team = {_normalize_team(g['home_team']): g for g in games}
+            game_by_team.update({_normalize_team(g['away_team']): g for g in games})
+            game_by_matchup = {(_normalize_team(g['home_team']), _normalize_team(g['away_team'])): g for g in games}
+            indexed = (games, game_by_team, game_by_matchup)
+            self._games_index = indexed
+        return indexed[1], indexed[2]
+    
     def get_best_lines(self, player_props: PlayerProps) -> Dict[str, BettingLine]:
         """
         Get the best available line for each prop type.
@@ -933,19 +1802,18 @@ class FantasyEdgeAnalyzer:
             Dictionary of prop_type -> best BettingLine
         """
         best_lines = {}
+        best_odds = {}
+        no_odds = -math.inf
         
-        # Group by prop type
-        props_by_type = {}
+        # Keep the best over odds (least negative or most positive) per type in one
+        # pass; the first line seen wins ties, including lines without over odds.
+        # A player has at most a few dozen lines, too few for NumPy to pay off
         for prop in player_props.betting_lines:
-            if prop.prop_type not in props_by_type:
-                props_by_type[prop.prop_type] = []
-            props_by_type[prop.prop_type].append(prop)
-        
-        # Find best for each type
-        for prop_type, props in props_by_type.items():
-            # Get best over odds (least negative or most positive)
-            best_over = max(props, key=lambda x: x.over_odds if x.over_odds else -999999)
-            best_lines[prop_type] = best_over
+            prop_type = prop.prop_type
+            odds = prop.over_odds or no_odds
+            if prop_type not in best_odds or odds > best_odds[prop_type]:
+                best_odds[prop_type] = odds
+                best_lines[prop_type] = prop
         
         return best_lines
     
@@ -962,29 +1830,28 @@ class FantasyEdgeAnalyzer:
         """
         value_plays = []
         
-        for player_name in roster_players:
-            try:
-                analysis = self.get_player_analysis(player_name)
-                if analysis.fantasy_projection and analysis.fantasy_projection.confidence >= (threshold / 10):
-                    # Calculate value based on confidence and projection
-                    value_score = analysis.fantasy_projection.projected_points * analysis.fantasy_projection.confidence
-                    
-                    value_plays.append({
-                        'player_name': player_name,
-                        'position': analysis.position.value if analysis.position else 'Unknown',
-                        'projected_points': analysis.fantasy_projection.projected_points,
-                        'confidence': analysis.fantasy_projection.confidence,
-                        'value_score': value_score,
-                        'breakdown': analysis.fantasy_projection.breakdown,
-                        'team': analysis.roster_info.team if analysis.roster_info else 'Unknown',
-                        'opponent': analysis.roster_info.opponent if analysis.roster_info else 'Unknown'
-                    })
-            except Exception as e:
-                print(f"Could not analyze {player_name}: {e}")
-                continue
+        # Analyze the whole roster concurrently
+        min_confidence = threshold / 10
+        for analysis in self.analyze_players(roster_players, "Finding value plays"):
+            projection = analysis.fantasy_projection
+            if projection and projection.confidence >= min_confidence:
+                # Calculate value based on confidence and projection
+                value_score = projection.projected_points * projection.confidence
+                roster_info = analysis.roster_info
+                
+                value_plays.append({
+                    'player_name': analysis.player_name,
+                    'position': analysis.position.value if analysis.position else 'Unknown',
+                    'projected_points': projection.projected_points,
+                    'confidence': projection.confidence,
+                    'value_score': value_score,
+                    'breakdown': projection.breakdown,
+                    'team': roster_info.team if roster_info else 'Unknown',
+                    'opponent': roster_info.opponent if roster_info else 'Unknown'
+                })
         
         # Sort by value score
-        value_plays.sort(key=lambda x: x['value_score'], reverse=True)
+        value_plays.sort(key=itemgetter('value_score'), reverse=True)
         
         return value_plays
     
@@ -1005,37 +1872,43 @@ class FantasyEdgeAnalyzer:
             # Try reversed team order
             all_players = self.get_all_players_in_game(team2, team1)
         
-        # Separate by team
+        # Separate by team, comparing normalized names exactly, and total
+        # each team's points in the same pass
         team1_players = []
         team2_players = []
+        team1_total = 0
+        team2_total = 0
+        team1_normalized = _normalize_team(team1)
         
         for player in all_players:
             if player.roster_info:
-                if player.roster_info.team.lower() in team1.lower():
+                points = player.fantasy_projection.projected_points if player.fantasy_projection else 0
+                if _normalize_team(player.roster_info.team) == team1_normalized:
                     team1_players.append(player)
+                    team1_total += points
                 else:
                     team2_players.append(player)
+                    team2_total += points
         
-        # Sort by projected points
-        team1_players.sort(key=lambda x: x.fantasy_projection.projected_points if x.fantasy_projection else 0, reverse=True)
-        team2_players.sort(key=lambda x: x.fantasy_projection.projected_points if x.fantasy_projection else 0, reverse=True)
+        # Only the top five per team are reported, so skip sorting the rest
+        def projected_points(player: PlayerProps) -> float:
+            return player.fantasy_projection.projected_points if player.fantasy_projection else 0
         
-        # Calculate team totals
-        team1_total = sum(p.fantasy_projection.projected_points if p.fantasy_projection else 0 for p in team1_players)
-        team2_total = sum(p.fantasy_projection.projected_points if p.fantasy_projection else 0 for p in team2_players)
+        team1_top = heapq.nlargest(5, team1_players, key=projected_points)
+        team2_top = heapq.nlargest(5, team2_players, key=projected_points)
         
         return {
             'matchup': f"{team1} vs {team2}",
             'team1': {
                 'name': team1,
                 'total_projected_points': team1_total,
-                'top_players': [p.to_dict() for p in team1_players[:5]],
+                'top_players': [p.to_dict() for p in team1_top],
                 'player_count': len(team1_players)
             },
             'team2': {
                 'name': team2,
                 'total_projected_points': team2_total,
-                'top_players': [p.to_dict() for p in team2_players[:5]],
+                'top_players': [p.to_dict() for p in team2_top],
                 'player_count': len(team2_players)
             },
             'game_total': team1_total + team2_total,
@@ -1044,32 +1917,64 @@ class FantasyEdgeAnalyzer:
     
     def export_to_json(self, player_props: PlayerProps, filename: str):
         """Export player analysis to JSON file"""
-        with open(filename, 'w') as f:
-            json.dump(player_props.to_dict(), f, indent=2)
+        # Write to a temp file and rename, so a crash never leaves a partial export
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'wb') as f:
+            f.write(_json_dumps(player_props.to_dict(), indent=True))
+        os.replace(tmp_filename, filename)
     
     def export_to_csv(self, player_props: PlayerProps, filename: str):
         """Export player analysis to CSV file"""
         import csv
         
-        with open(filename, 'w', newline='') as f:
+        # Same temp-file-and-rename as export_to_json
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, 'w', newline='') as f:
             writer = csv.writer(f)
             writer.writerow(['Player', 'Position', 'Team', 'Opponent', 'Projected Points', 
                            'Confidence', 'Prop Type', 'Line', 'Over Odds', 'Under Odds', 'Bookmaker'])
             
-            for line in player_props.betting_lines:
-                writer.writerow([
-                    player_props.player_name,
-                    player_props.position.value if player_props.position else 'Unknown',
-                    player_props.roster_info.team if player_props.roster_info else 'Unknown',
-                    player_props.roster_info.opponent if player_props.roster_info else 'Unknown',
-                    player_props.fantasy_projection.projected_points if player_props.fantasy_projection else 0,
-                    player_props.fantasy_projection.confidence if player_props.fantasy_projection else 0,
-                    line.prop_type,
-                    line.line,
-                    line.over_odds,
-                    line.under_odds,
-                    line.bookmaker
-                ])
+            # Player-level columns are the same on every row
+            projection = player_props.fantasy_projection
+            roster_info = player_props.roster_info
+            base = (
+                player_props.player_name,
+                player_props.position.value if player_props.position else 'Unknown',
+                roster_info.team if roster_info else 'Unknown',
+                roster_info.opponent if roster_info else 'Unknown',
+                projection.projected_points if projection else 0,
+                projection.confidence if projection else 0,
+            )
+            writer.writerows(
+                (*base, line.prop_type, line.line, line.over_odds, line.under_odds, line.bookmaker)
+                for line in player_props.betting_lines
+            )
+        os.replace(tmp_filename, filename)
+
+
+_shared_analyzers: Dict[Tuple, FantasyEdgeAnalyzer] = {}
+_shared_analyzers_lock = threading.Lock()
+
+
+def get_analyzer(scoring: Optional[FantasyScoring] = None) -> FantasyEdgeAnalyzer:
+    """
+    Get the shared analyzer for a scoring system, creating it on first use.
+    
+    Scripts and notebooks that run repeatedly in one process reuse its HTTP
+    session and response caches instead of rebuilding them. Don't call
+    set_scoring on a shared analyzer; ask for one with the other scoring instead.
+    
+    Args:
+        scoring: League scoring settings (None = default PPR scoring)
+    """
+    scoring = scoring or FantasyScoring()
+    key = astuple(scoring)
+    with _shared_analyzers_lock:
+        analyzer = _shared_analyzers.get(key)
+        if analyzer is None:
+            analyzer = _shared_analyzers[key] = FantasyEdgeAnalyzer()
+            analyzer.set_scoring(scoring)
+    return analyzer
 
 
 # Example usage
@@ -13,69 +13,77 @@ Your Current Roster:
 - DEF: Cincinnati
 """
 
-import os
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    print("Warning: python-dotenv not installed")
+from concurrent.futures import ThreadPoolExecutor
 
-from betting_lines_fetcher import FantasyEdgeAnalyzer, Position
+# Importing betting_lines_fetcher loads .env
+from betting_lines_fetcher import Position, get_analyzer
 from fantasy_tools import FantasyTools, DFSConstraints
 from league_configs import LeagueConfigs
 
+# Your current roster (using exact player names) as (player, position, starter)
+_ROSTER = (
+    ("Dak Prescott", "QB", True),  # D Prescott
+    ("Jonathan Taylor", "RB", True),  # J Taylor
+    ("James Conner", "RB", True),  # J Conner
+    ("CeeDee Lamb", "WR", True),  # C Lamb
+    ("Tee Higgins", "WR", True),  # T Higgins
+    ("Jaylen Smith", "TE", True),  # J Smith (PIT)
+    ("Jake Elliott", "K", True),  # J Elliott
+    ("Cincinnati", "DEF", True),
+    ("Justin Herbert", "QB", False),  # J Herbert
+    ("Keontay Johnson", "RB", False),  # K Johnson
+    ("Bucky Robinson", "RB", False),  # B Robinson
+    ("DK Metcalf", "WR", False),  # D Metcalf
+    ("DeVonta Smith", "WR", False),  # D Smith
+    ("Darnell Mooney", "WR", False),  # D Mooney
+    ("Jaylen Waddle", "WR", False),  # J Waddle
+)
+
+# All your players for analysis (skip kicker and defense for now)
+_ANALYZED_PLAYERS = [player for player, position, _ in _ROSTER if position not in ("K", "DEF")]
+
+
 def analyze_chimpzone_roster():
     """Analyze your ChimpZone 2025 roster with custom league settings"""
     
     print("🐒 CHIMPZONE 2025 ANALYSIS 🐒\n")
     
-    # Initialize analyzer with ChimpZone settings
-    analyzer = FantasyEdgeAnalyzer()
-    tools = FantasyTools(analyzer)
-    
     # Load ChimpZone 2025 league configuration
     chimpzone_config = LeagueConfigs.chimpzone_2025()
-    analyzer.set_scoring(chimpzone_config.scoring)
+    
+    # Initialize analyzer with ChimpZone settings
+    analyzer = get_analyzer(chimpzone_config.scoring)
+    tools = FantasyTools(analyzer)
     
     print(f"📊 League: {chimpzone_config.name}")
     print(f"   Passing TDs: {chimpzone_config.scoring.pass_td_points} pts")
     print(f"   Reception Points: {chimpzone_config.scoring.reception_points} (Full PPR)")
     print(f"   50+ Yard TD Bonus: +{chimpzone_config.scoring.long_td_bonus}")
     print(f"   Trade Deadline: Week {chimpzone_config.trade_deadline_week}")
-    print(f"   Playoffs: Weeks {chimpzone_config.playoff_weeks}\n")
-    
-    # Your current roster (using exact player names)
-    your_roster = {
-        "starters": {
-            "QB": ["Dak Prescott"],  # D Prescott
-            "RB": ["Jonathan Taylor", "James Conner"],  # J Taylor, J Conner
-            "WR": ["CeeDee Lamb", "Tee Higgins"],  # C Lamb, T Higgins
-            "TE": ["Jaylen Smith"],  # J Smith (PIT)
-            "K": ["Jake Elliott"],  # J Elliott
-            "DEF": ["Cincinnati"]
-        },
-        "bench": {
-            "QB": ["Justin Herbert"],  # J Herbert
-            "RB": ["Keontay Johnson", "Bucky Robinson"],  # K Johnson, B Robinson
-            "WR": ["DK Metcalf", "DeVonta Smith", "Darnell Mooney", "Jaylen Waddle"]  # D Metcalf, D Smith, D Mooney, J Waddle
-        }
-    }
-    
-    # All your players for analysis
-    all_players = []
-    for position_group in your_roster.values():
-        for position, players in position_group.items():
-            if position != "K" and position != "DEF":  # Skip kicker and defense for now
-                all_players.extend(players)
+    print(f"   Playoffs: Weeks {', '.join(map(str, chimpzone_config.playoff_weeks))}\n")
+    
+    # Potential waiver targets (you'd update these based on available players)
+    waiver_candidates = [
+        "Gus Edwards", "Jaylen Warren", "Tank Bigsby",  # RBs
+        "Romeo Doubs", "Darius Slayton", "Elijah Moore",  # WRs
+        "Tyler Higbee", "Cade Otton"  # TEs
+    ]
+    
+    api_key = analyzer.api_key  # Resolved from the environment once, by the analyzer
+    if api_key:
+        # Fetch every player's game once up front; each section below reuses it
+        try:
+            analyzer.prefetch_players(_ANALYZED_PLAYERS + waiver_candidates + ["Saquon Barkley"])
+        except Exception as e:
+            print(f"⚠️  Prefetch failed, fetching per section instead: {e}")
     
     print("=" * 60)
     print("🎯 OPTIMAL LINEUP ANALYSIS")
     print("=" * 60)
     
-    api_key = os.getenv('ODDS_API_KEY')
     if api_key:
         try:
-            optimal = analyzer.optimize_lineup(all_players, chimpzone_config.roster_requirements)
+            optimal = analyzer.optimize_lineup(_ANALYZED_PLAYERS, chimpzone_config.roster_requirements)
             
             print("🏆 OPTIMAL STARTING LINEUP:")
             total_points = 0
@@ -107,13 +115,23 @@ def analyze_chimpzone_roster():
         ("Darnell Mooney", "Jaylen Waddle", "Flex consideration")
     ]
     
+    comparisons = {}
+    if api_key:
+        # The comparisons are independent, so run them side by side and print
+        # the results in order once they're all in
+        with ThreadPoolExecutor(max_workers=len(key_decisions)) as executor:
+            comparisons = {
+                (player1, player2): executor.submit(analyzer.compare_players, player1, player2)
+                for player1, player2, _ in key_decisions
+            }
+    
     for player1, player2, decision_type in key_decisions:
         print(f"\n🤔 {decision_type.upper()}:")
         print(f"   Comparing {player1} vs {player2}")
         
         if api_key:
             try:
-                comparison = analyzer.compare_players(player1, player2)
+                comparison = comparisons[(player1, player2)].result()
                 print(f"   ✅ {comparison['recommendation']}")
                 print(f"   Point difference: {comparison['analysis']['point_difference']:.2f}")
             except Exception as e:
@@ -125,13 +143,6 @@ def analyze_chimpzone_roster():
     print("📈 WAIVER WIRE TARGETS")
     print("=" * 60)
     
-    # Potential waiver targets (you'd update these based on available players)
-    waiver_candidates = [
-        "Gus Edwards", "Jaylen Warren", "Tank Bigsby",  # RBs
-        "Romeo Doubs", "Darius Slayton", "Elijah Moore",  # WRs
-        "Tyler Higbee", "Cade Otton"  # TEs
-    ]
-    
     roster_needs = [Position.RB, Position.WR, Position.TE]  # Areas to improve
     
     print("Analyzing potential waiver targets...")
@@ -139,7 +150,7 @@ def analyze_chimpzone_roster():
     
     if api_key:
         try:
-            targets = tools.get_waiver_targets(waiver_candidates, roster_needs, max_ownership=75)
+            targets = tools.get_waiver_targets(waiver_candidates, roster_needs, max_ownership=75, top_k=3)
             
             print("\n🎯 TOP WAIVER TARGETS:")
             for i, target in enumerate(targets[:3], 1):
@@ -189,33 +200,32 @@ def analyze_chimpzone_roster():
     print("📊 SEASON OUTLOOK")
     print("=" * 60)
     
-    print("🟢 STRENGTHS:")
-    print("   • Elite WR1 in CeeDee Lamb")
-    print("   • Strong RB1 in Jonathan Taylor")
-    print("   • Solid QB depth with Dak/Herbert")
-    print("   • Deep WR corps for bye weeks")
-    
-    print("\n🟡 AREAS TO MONITOR:")
-    print("   • TE production from Jaylen Smith")
-    print("   • RB2 consistency from James Conner")  
-    print("   • Health of key players")
-    
-    print("\n🔴 POTENTIAL CONCERNS:")
-    print("   • Lack of elite TE option")
-    print("   • RB depth beyond Taylor/Conner")
-    print("   • WR target share volatility")
-    
-    print("\n💡 WEEKLY TIPS:")
-    print("   • Monitor weather for DAL @ PHI (Thursday)")
-    print("   • Check injury reports Tuesday/Wednesday")
-    print("   • Consider matchup-based start/sit decisions")
-    print("   • Track target share trends for WRs")
-    
-    print("\n🏆 CHAMPIONSHIP STRATEGY:")
-    print("   • Target playoff weeks 15-17 schedules")
-    print("   • Consider late-season trades for playoff studs")
-    print("   • Handcuff your key RBs if possible")
-    print("   • Stream favorable matchups at TE/DEF")
+    # Static text; written in one go rather than a print per line
+    print("\n".join((
+        "🟢 STRENGTHS:",
+        "   • Elite WR1 in CeeDee Lamb",
+        "   • Strong RB1 in Jonathan Taylor",
+        "   • Solid QB depth with Dak/Herbert",
+        "   • Deep WR corps for bye weeks",
+        "\n🟡 AREAS TO MONITOR:",
+        "   • TE production from Jaylen Smith",
+        "   • RB2 consistency from James Conner",
+        "   • Health of key players",
+        "\n🔴 POTENTIAL CONCERNS:",
+        "   • Lack of elite TE option",
+        "   • RB depth beyond Taylor/Conner",
+        "   • WR target share volatility",
+        "\n💡 WEEKLY TIPS:",
+        "   • Monitor weather for DAL @ PHI (Thursday)",
+        "   • Check injury reports Tuesday/Wednesday",
+        "   • Consider matchup-based start/sit decisions",
+        "   • Track target share trends for WRs",
+        "\n🏆 CHAMPIONSHIP STRATEGY:",
+        "   • Target playoff weeks 15-17 schedules",
+        "   • Consider late-season trades for playoff studs",
+        "   • Handcuff your key RBs if possible",
+        "   • Stream favorable matchups at TE/DEF",
+    )))
 
 if __name__ == "__main__":
     analyze_chimpzone_roster()
@@ -8,13 +8,9 @@ Run this script to see various features in action.
 """
 
 import os
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load .env file
-except ImportError:
-    print("Warning: python-dotenv not installed")
 
-from betting_lines_fetcher import FantasyEdgeAnalyzer, Position
+# Importing betting_lines_fetcher loads .env
+from betting_lines_fetcher import Position, get_analyzer
 from fantasy_tools import FantasyTools, DFSConstraints
 from league_configs import LeagueConfigs
 
@@ -36,13 +32,12 @@ def main():
     else:
         print("✅ API key found! Running with live data...\n")
     
-    # Initialize the analyzer
-    analyzer = FantasyEdgeAnalyzer()
-    tools = FantasyTools(analyzer)
-    
     # Set up league configuration
     league_config = LeagueConfigs.half_ppr()  # Use half PPR scoring
-    analyzer.set_scoring(league_config.scoring)
+    
+    # Initialize the analyzer
+    analyzer = get_analyzer(league_config.scoring)
+    tools = FantasyTools(analyzer)
     
     print(f"📊 League Configuration: {league_config.name}")
     print(f"   Reception Points: {league_config.scoring.reception_points}")
@@ -50,6 +45,28 @@ def main():
     print(f"   Rush/Rec TD Points: {league_config.scoring.rush_td_points}")
     print("\n💡 TIP: Run 'python chimpzone_analysis.py' for ChimpZone 2025 specific analysis\n")
     
+    # Your roster and the players available on waivers; the DFS and breakout
+    # pools below extend these
+    my_roster = [
+        "Josh Allen", "Dak Prescott",  # QBs
+        "Saquon Barkley", "Derrick Henry", "Alvin Kamara", "Josh Jacobs",  # RBs
+        "Tyreek Hill", "Davante Adams", "Cooper Kupp", "Mike Evans",  # WRs
+        "Travis Kelce", "Mark Andrews"  # TEs
+    ]
+    
+    available_players = [
+        "Gus Edwards", "Jaylen Warren", "Deon Jackson",
+        "Elijah Moore", "Darius Slayton", "Romeo Doubs",
+        "Tyler Higbee", "Cade Otton"
+    ]
+    
+    if api_key:
+        # Fetch their games once up front; each example below reuses them
+        try:
+            analyzer.prefetch_players(my_roster + available_players)
+        except Exception as e:
+            print(f"⚠️  Prefetch failed, fetching per example instead: {e}")
+    
     # Example 1: Compare two players
     print("=" * 50)
     print("🔥 PLAYER COMPARISON")
@@ -80,13 +97,6 @@ def main():
     print("🎯 LINEUP OPTIMIZATION")
     print("=" * 50)
     
-    my_roster = [
-        "Josh Allen", "Dak Prescott",  # QBs
-        "Saquon Barkley", "Derrick Henry", "Alvin Kamara", "Josh Jacobs",  # RBs
-        "Tyreek Hill", "Davante Adams", "Cooper Kupp", "Mike Evans",  # WRs
-        "Travis Kelce", "Mark Andrews"  # TEs
-    ]
-    
     print("Your Roster:")
     print("   QBs: Josh Allen, Dak Prescott")
     print("   RBs: Saquon Barkley, Derrick Henry, Alvin Kamara, Josh Jacobs")
@@ -146,12 +156,6 @@ def main():
     print("📈 WAIVER WIRE TARGETS")
     print("=" * 50)
     
-    available_players = [
-        "Gus Edwards", "Jaylen Warren", "Deon Jackson",
-        "Elijah Moore", "Darius Slayton", "Romeo Doubs",
-        "Tyler Higbee", "Cade Otton"
-    ]
-    
     roster_needs = [Position.RB, Position.WR]
     
     print("Available Players:", ", ".join(available_players))
@@ -159,7 +163,7 @@ def main():
     
     if api_key:
         try:
-            targets = tools.get_waiver_targets(available_players, roster_needs)
+            targets = tools.get_waiver_targets(available_players, roster_needs, top_k=3)
             print("\n🎯 TOP WAIVER TARGETS:")
             for i, target in enumerate(targets[:3], 1):
                 print(f"   {i}. {target.player_name} ({target.position.value})")
@@ -184,9 +188,10 @@ def main():
     print("💰 DFS LINEUP OPTIMIZATION")
     print("=" * 50)
     
-    # Switch to DFS configuration
+    # Switch to DFS configuration (a separate analyzer, so the half PPR one
+    # stays as it was)
     dfs_config = LeagueConfigs.draftkings_dfs()
-    analyzer.set_scoring(dfs_config.scoring)
+    tools = FantasyTools(get_analyzer(dfs_config.scoring))
     
     dfs_player_pool = my_roster + available_players + [
         "Justin Jefferson", "Stefon Diggs", "CeeDee Lamb",  # More WRs
@@ -241,7 +246,7 @@ def main():
     
     if api_key:
         try:
-            breakouts = tools.get_breakout_candidates(extended_player_pool)
+            breakouts = tools.get_breakout_candidates(extended_player_pool, top_k=3)
             print("🔥 TOP BREAKOUT CANDIDATES:")
             for i, candidate in enumerate(breakouts[:3], 1):
                 print(f"   {i}. {candidate['player_name']} ({candidate['position']})")
@@ -264,19 +269,21 @@ def main():
     print("✅ ANALYSIS COMPLETE")
     print("=" * 50)
     
-    print("\n💡 FANTASY TIPS:")
-    print("• Higher confidence scores indicate more reliable projections")
-    print("• Always consider injury reports and weather conditions")
-    print("• Use matchup analysis for tough start/sit decisions")
-    print("• Monitor target share and red zone opportunities")
-    print("• Consider stacking QB with WR/TE in DFS formats")
-    
-    print("\n🔧 NEXT STEPS:")
-    print("• Add your actual roster players to the roster lists")
-    print("• Set up your specific league scoring in league_configs.py")
-    print("• Run analysis weekly to optimize your lineups")
-    print("• Use trade analyzer before making any deals")
-    print("• Check waiver targets every Tuesday night")
+    # Static text; written in one go rather than a print per line
+    print("\n".join((
+        "\n💡 FANTASY TIPS:",
+        "• Higher confidence scores indicate more reliable projections",
+        "• Always consider injury reports and weather conditions",
+        "• Use matchup analysis for tough start/sit decisions",
+        "• Monitor target share and red zone opportunities",
+        "• Consider stacking QB with WR/TE in DFS formats",
+        "\n🔧 NEXT STEPS:",
+        "• Add your actual roster players to the roster lists",
+        "• Set up your specific league scoring in league_configs.py",
+        "• Run analysis weekly to optimize your lineups",
+        "• Use trade analyzer before making any deals",
+        "• Check waiver targets every Tuesday night",
+    )))
     
     if not api_key:
         print("\n🚨 IMPORTANT:")
@@ -12,15 +12,62 @@ Date: 2024-2025
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import bisect
+import heapq
 import itertools
+from collections import Counter, defaultdict
+from operator import itemgetter
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from betting_lines_fetcher import (
     FantasyEdgeAnalyzer, FantasyScoring, Position, PlayerProps, 
-    FantasyProjection, PlayerRosterInfo, ProgressBar
+    FantasyProjection, PlayerRosterInfo
+)
+
+# PuLP solves DFS lineups exactly when installed; otherwise they're built greedily
+try:
+    import pulp
+except ImportError:
+    pulp = None
+
+# Explanation ladders: a score strictly above the i-th threshold earns message i + 1
+_TRADE_EXPLANATIONS = (
+    (-5, -1, 1, 5),
+    (
+        "Strongly unfavorable trade - avoid this deal",
+        "Unfavorable trade - you're giving up value",
+        "Fair trade - roughly equal value",
+        "Favorable trade - slight advantage to you",
+        "Strongly favorable trade - you're getting significant value",
+    ),
+)
+_BREAKOUT_REASONS = (
+    (9, 12, 15),
+    (
+        "Speculative breakout candidate with moderate upside",
+        "Solid upside play with reliable floor",
+        "Strong multi-category potential with high confidence",
+        "Elite projection with multiple touchdown upside categories",
+    ),
 )
 
 
+def _rank_scores(scores: np.ndarray, top_k: Optional[int] = None) -> List[int]:
+    """Indices of scores from highest to lowest (stable), limited to the best top_k when given"""
+    key = scores.__getitem__
+    if top_k is not None:
+        return heapq.nlargest(top_k, range(len(scores)), key=key)
+    return sorted(range(len(scores)), key=key, reverse=True)
+
+
+def _ladder_message(ladder: Tuple[Tuple[float, ...], Tuple[str, ...]], score: float) -> str:
+    """Look up the message for a score in a (thresholds, messages) ladder"""
+    thresholds, messages = ladder
+    return messages[bisect.bisect_left(thresholds, score)]
+
+
 class LeagueType(Enum):
     """Types of fantasy leagues"""
     REDRAFT = "redraft"
@@ -35,7 +82,7 @@ class TradeDirection(Enum):
     RECEIVE = "receive"
 
 
-@dataclass
+@dataclass(slots=True)
 class DFSConstraints:
     """Constraints for DFS lineup optimization"""
     salary_cap: int = 50000
@@ -46,7 +93,7 @@ class DFSConstraints:
     must_include: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeProposal:
     """Represents a fantasy trade proposal"""
     give_players: List[str]
@@ -56,7 +103,7 @@ class TradeProposal:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class WaiverTarget:
     """Represents a waiver wire target"""
     player_name: str
@@ -67,6 +114,14 @@ class WaiverTarget:
     reason: str
 
 
+# Player value multipliers by league type (DFS weighs by projection confidence instead).
+# Dynasty gets a premium for long-term value; in a real implementation you'd
+# factor in player age data
+_LEAGUE_VALUE_MULTIPLIERS = {
+    LeagueType.DYNASTY: 1.2,
+}
+
+
 class FantasyTools:
     """Advanced fantasy football tools and utilities"""
     
@@ -99,19 +154,12 @@ class FantasyTools:
         
         print(f"💰 Optimizing DFS lineup from {len(player_pool)} players...")
         
-        # Get player analyses
-        player_analyses = {}
-        progress = ProgressBar(len(player_pool), "Analyzing DFS pool")
-        
-        for player_name in player_pool:
-            progress.update()
-            try:
-                analysis = self.analyzer.get_player_analysis(player_name)
-                if analysis.fantasy_projection and analysis.roster_info:
-                    player_analyses[player_name] = analysis
-            except Exception as e:
-                print(f"\n⚠️  Could not analyze {player_name}: {e}")
-                continue
+        # Get player analyses (concurrently; players that fail are skipped)
+        player_analyses = {
+            analysis.player_name: analysis
+            for analysis in self.analyzer.analyze_players(player_pool, "Analyzing DFS pool")
+            if analysis.fantasy_projection and analysis.roster_info
+        }
         
         # Filter out banned players
         if constraints.banned_players:
@@ -119,11 +167,9 @@ class FantasyTools:
                 player_analyses.pop(banned, None)
         
         # Group by position
-        players_by_position = {}
+        players_by_position = defaultdict(list)
         for player_name, analysis in player_analyses.items():
             position = analysis.position
-            if position not in players_by_position:
-                players_by_position[position] = []
             
             # Calculate points per dollar for DFS value
             salary = analysis.roster_info.salary or 5000  # Default salary if not provided
@@ -140,13 +186,101 @@ class FantasyTools:
         
         # Sort each position by points per dollar
         for position in players_by_position:
-            players_by_position[position].sort(key=lambda x: x['points_per_dollar'], reverse=True)
+            players_by_position[position].sort(key=itemgetter('points_per_dollar'), reverse=True)
         
-        # Use greedy algorithm to build optimal lineup
-        optimal_lineup = self._build_dfs_lineup(players_by_position, lineup_requirements, constraints)
+        # Solve for the optimal lineup exactly when PuLP is available, falling back
+        # to the greedy builder without it or if no lineup meets every constraint
+        optimal_lineup = None
+        if pulp is not None:
+            optimal_lineup = self._solve_dfs_lineup(players_by_position, lineup_requirements, constraints)
+        if optimal_lineup is None:
+            optimal_lineup = self._build_dfs_lineup(players_by_position, lineup_requirements, constraints)
         
         return optimal_lineup
     
+    def _solve_dfs_lineup(self, players_by_position: Dict[Position, List[Dict]],
+                          lineup_requirements: Dict[Position, int],
+                          constraints: DFSConstraints) -> Optional[Dict[str, Any]]:
+        """
+        Find the highest-scoring DFS lineup with a 0/1 integer program (PuLP + CBC).
+        
+        Returns:
+            Same shape as _build_dfs_lineup, or None if the solver finds no lineup
+            that satisfies every constraint
+        """
+        pool = [
+            (position, player)
+            for position in lineup_requirements
+            for player in players_by_position.get(position, [])
+        ]
+        if not pool:
+            return None
+        
+        problem = pulp.LpProblem("dfs_lineup", pulp.LpMaximize)
+        picks = [pulp.LpVariable(f"x{i}", cat=pulp.LpBinary) for i in range(len(pool))]
+        problem += pulp.lpSum(player['projected_points'] * x for (_, player), x in zip(pool, picks))
+        
+        salary = pulp.lpSum(player['salary'] * x for (_, player), x in zip(pool, picks))
+        problem += salary <= constraints.salary_cap
+        if constraints.min_salary:
+            problem += salary >= constraints.min_salary
+        
+        picks_by_position = defaultdict(list)
+        picks_by_team = defaultdict(list)
+        for (position, player), x in zip(pool, picks):
+            picks_by_position[position].append(x)
+            picks_by_team[player['team']].append(x)
+        
+        # Fill every slot the pool can fill; leaving one empty to afford a star
+        # would otherwise look better than a complete lineup
+        for position, required_count in lineup_requirements.items():
+            position_picks = picks_by_position[position]
+            problem += pulp.lpSum(position_picks) == min(required_count, len(position_picks))
+        for team_picks in picks_by_team.values():
+            problem += pulp.lpSum(team_picks) <= constraints.max_players_per_team
+        
+        for player_name in constraints.must_include or []:
+            matches = [x for (_, player), x in zip(pool, picks) if player['name'] == player_name]
+            if matches:
+                problem += pulp.lpSum(matches) == 1
+        
+        # Stacks like {"QB-WR": 1}: every chosen QB brings at least that many of
+        # their team's WRs
+        for stack, count in (constraints.stack_requirements or {}).items():
+            try:
+                anchor, partner = (Position(value) for value in stack.split('-'))
+            except ValueError:
+                # Not two known positions (e.g. "QB-FLEX" or a typo)
+                print(f"⚠️  Ignoring unknown stack requirement '{stack}'")
+                continue
+            for (position, player), x in zip(pool, picks):
+                if position == anchor:
+                    teammates = [
+                        y for (other_position, other), y in zip(pool, picks)
+                        if other_position == partner and other['team'] == player['team']
+                    ]
+                    problem += pulp.lpSum(teammates) >= count * x
+        
+        problem.solve(pulp.PULP_CBC_CMD(msg=0))
+        if pulp.LpStatus[problem.status] != 'Optimal':
+            return None
+        
+        lineup = {position: [] for position in lineup_requirements}
+        for (position, player), x in zip(pool, picks):
+            if x.value() > 0.5:
+                lineup[position].append(player)
+        team_counts = Counter(player['team'] for players in lineup.values() for player in players)
+        
+        total_salary = sum(player['salary'] for players in lineup.values() for player in players)
+        return {
+            'lineup': {pos.value: [p['name'] for p in players] for pos, players in lineup.items()},
+            'lineup_details': lineup,
+            'total_salary': total_salary,
+            'total_projected_points': sum(p['projected_points'] for players in lineup.values() for p in players),
+            'salary_remaining': constraints.salary_cap - total_salary,
+            'team_distribution': dict(team_counts)
+        }
+    
     def _build_dfs_lineup(self, players_by_position: Dict[Position, List[Dict]], 
                          lineup_requirements: Dict[Position, int],
                          constraints: DFSConstraints) -> Dict[str, Any]:
@@ -155,56 +289,93 @@ class FantasyTools:
         lineup = {}
         total_salary = 0
         total_points = 0
-        team_counts = {}
+        team_counts = Counter()
         
         # Must include players first
         if constraints.must_include:
+            locations = {
+                player['name']: (position, index)
+                for position, players in players_by_position.items()
+                for index, player in enumerate(players)
+            }
+            locked = defaultdict(set)  # Position -> indices of players moved into the lineup
+            
             for player_name in constraints.must_include:
-                for position, players in players_by_position.items():
-                    player_found = False
-                    for player in players:
-                        if player['name'] == player_name:
-                            if position not in lineup:
-                                lineup[position] = []
-                            if len(lineup[position]) < lineup_requirements.get(position, 0):
-                                lineup[position].append(player)
-                                total_salary += player['salary']
-                                total_points += player['projected_points']
-                                team = player['team']
-                                team_counts[team] = team_counts.get(team, 0) + 1
-                                players.remove(player)
-                                player_found = True
-                                break
-                    if player_found:
-                        break
+                location = locations.get(player_name)
+                if location is None or location[1] in locked.get(location[0], ()):
+                    continue
+                position, index = location
+                if position not in lineup:
+                    lineup[position] = []
+                if len(lineup[position]) < lineup_requirements.get(position, 0):
+                    player = players_by_position[position][index]
+                    lineup[position].append(player)
+                    total_salary += player['salary']
+                    total_points += player['projected_points']
+                    team = player['team']
+                    team_counts[team] += 1
+                    locked[position].add(index)
+            
+            # Take the locked players out of the pool in one pass per position
+            for position, indices in locked.items():
+                players_by_position[position] = [
+                    player for index, player in enumerate(players_by_position[position])
+                    if index not in indices
+                ]
+        
+        # Cheapest possible cost of filling k more slots at each position, so a
+        # pick is only taken if the open slots can still be filled under the cap
+        cheapest_costs = {
+            position: list(itertools.accumulate(sorted(player['salary'] for player in players), initial=0))
+            for position, players in players_by_position.items()
+        }
+        still_needed = {
+            position: min(max(required_count - len(lineup.get(position, ())), 0),
+                          len(players_by_position.get(position, ())))
+            for position, required_count in lineup_requirements.items()
+        }
+        reserved_salary = sum(cheapest_costs[position][needed] for position, needed in still_needed.items() if needed)
+        
+        # Fill remaining positions, stopping once every slot is taken
+        for position in lineup_requirements:
+            lineup.setdefault(position, [])
+        open_slots = sum(still_needed.values())
         
-        # Fill remaining positions
         for position, required_count in lineup_requirements.items():
-            if position not in lineup:
-                lineup[position] = []
-                
+            if not open_slots:
+                break
+            
             current_count = len(lineup[position])
             remaining_needed = required_count - current_count
             
             if remaining_needed > 0 and position in players_by_position:
-                for player in players_by_position[position][:remaining_needed * 3]:  # Consider top options
+                for player in itertools.islice(players_by_position[position], remaining_needed * 3):  # Consider top options
                     if len(lineup[position]) >= required_count:
                         break
-                        
-                    # Check salary constraint
-                    if total_salary + player['salary'] > constraints.salary_cap:
+                    
+                    # Check salary constraint, leaving room for the other open slots
+                    needed = still_needed[position]
+                    reserve_after = reserved_salary
+                    if needed:
+                        costs = cheapest_costs[position]
+                        reserve_after += costs[needed - 1] - costs[needed]
+                    if total_salary + player['salary'] + reserve_after > constraints.salary_cap:
                         continue
                     
                     # Check team stacking constraint
                     team = player['team']
-                    if team_counts.get(team, 0) >= constraints.max_players_per_team:
+                    if team_counts[team] >= constraints.max_players_per_team:
                         continue
                     
                     # Add player to lineup
                     lineup[position].append(player)
                     total_salary += player['salary']
                     total_points += player['projected_points']
-                    team_counts[team] = team_counts.get(team, 0) + 1
+                    team_counts[team] += 1
+                    if needed:
+                        still_needed[position] = needed - 1
+                        reserved_salary = reserve_after
+                        open_slots -= 1
         
         return {
             'lineup': {pos.value: [p['name'] for p in players] for pos, players in lineup.items()},
@@ -212,7 +383,7 @@ class FantasyTools:
             'total_salary': total_salary,
             'total_projected_points': total_points,
             'salary_remaining': constraints.salary_cap - total_salary,
-            'team_distribution': team_counts
+            'team_distribution': dict(team_counts)
         }
     
     def analyze_trade(self, give_players: List[str], receive_players: List[str],
@@ -228,52 +399,24 @@ class FantasyTools:
         Returns:
             TradeProposal with analysis
         """
-        # Get analyses for all players
-        give_analyses = []
-        receive_analyses = []
-        
-        for player in give_players:
-            try:
-                analysis = self.analyzer.get_player_analysis(player)
-                give_analyses.append(analysis)
-            except Exception as e:
-                print(f"Could not analyze {player}: {e}")
-        
-        for player in receive_players:
-            try:
-                analysis = self.analyzer.get_player_analysis(player)
-                receive_analyses.append(analysis)
-            except Exception as e:
-                print(f"Could not analyze {player}: {e}")
-        
-        # Calculate total values
-        give_value = sum(
-            self._calculate_player_value(analysis, league_type) 
-            for analysis in give_analyses
-        )
+        # Get analyses for all players in one concurrent batch
+        analyses = {
+            analysis.player_name: analysis
+            for analysis in self.analyzer.analyze_players(give_players + receive_players, "Analyzing trade")
+        }
+        give_analyses = [analyses[player] for player in give_players if player in analyses]
+        receive_analyses = [analyses[player] for player in receive_players if player in analyses]
         
-        receive_value = sum(
-            self._calculate_player_value(analysis, league_type) 
-            for analysis in receive_analyses
-        )
+        # Calculate total values and projection confidence for each side
+        give_value, give_confidence = self._summarize_trade_side(give_analyses, league_type)
+        receive_value, receive_confidence = self._summarize_trade_side(receive_analyses, league_type)
         
         trade_value = receive_value - give_value
         
         # Generate explanation
-        if trade_value > 5:
-            explanation = "Strongly favorable trade - you're getting significant value"
-        elif trade_value > 1:
-            explanation = "Favorable trade - slight advantage to you"
-        elif trade_value > -1:
-            explanation = "Fair trade - roughly equal value"
-        elif trade_value > -5:
-            explanation = "Unfavorable trade - you're giving up value"
-        else:
-            explanation = "Strongly unfavorable trade - avoid this deal"
+        explanation = _ladder_message(_TRADE_EXPLANATIONS, trade_value)
         
         # Calculate confidence based on projection quality
-        give_confidence = sum(a.fantasy_projection.confidence for a in give_analyses if a.fantasy_projection) / len(give_analyses) if give_analyses else 0
-        receive_confidence = sum(a.fantasy_projection.confidence for a in receive_analyses if a.fantasy_projection) / len(receive_analyses) if receive_analyses else 0
         overall_confidence = (give_confidence + receive_confidence) / 2
         
         return TradeProposal(
@@ -284,26 +427,33 @@ class FantasyTools:
             confidence=overall_confidence
         )
     
+    def _summarize_trade_side(self, analyses: List[PlayerProps], league_type: LeagueType) -> Tuple[float, float]:
+        """Total value and average projection confidence for one side of a trade, in a single pass"""
+        value = 0.0
+        confidence = 0.0
+        for analysis in analyses:
+            value += self._calculate_player_value(analysis, league_type)
+            if analysis.fantasy_projection:
+                confidence += analysis.fantasy_projection.confidence
+        
+        # Players without a projection count as zero confidence
+        return value, (confidence / len(analyses) if analyses else 0)
+    
     def _calculate_player_value(self, analysis: PlayerProps, league_type: LeagueType) -> float:
         """Calculate player value based on projections and league type"""
-        if not analysis.fantasy_projection:
+        projection = analysis.fantasy_projection
+        if not projection:
             return 0.0
         
-        base_value = analysis.fantasy_projection.projected_points
-        
-        # Adjust for league type
-        if league_type == LeagueType.DYNASTY:
-            # Factor in age and long-term value (simplified)
-            # In a real implementation, you'd have player age data
-            base_value *= 1.2  # Dynasty premium
-        elif league_type == LeagueType.DFS:
-            # DFS focuses on single-week performance
-            base_value *= analysis.fantasy_projection.confidence
+        # DFS focuses on single-week performance
+        if league_type == LeagueType.DFS:
+            return projection.projected_points * projection.confidence
         
-        return base_value
+        # Other league types scale by a fixed multiplier
+        return projection.projected_points * _LEAGUE_VALUE_MULTIPLIERS.get(league_type, 1.0)
     
     def get_waiver_targets(self, available_players: List[str], roster_needs: List[Position],
-                          max_ownership: float = 50.0) -> List[WaiverTarget]:
+                          max_ownership: float = 50.0, top_k: Optional[int] = None) -> List[WaiverTarget]:
         """
         Identify the best waiver wire targets based on projections and availability.
         
@@ -311,67 +461,51 @@ class FantasyTools:
             available_players: List of available player names
             roster_needs: Positions you need to improve
             max_ownership: Maximum ownership percentage to consider
+            top_k: Only return this many of the best targets (all when None)
             
         Returns:
             List of WaiverTarget objects ranked by priority
         """
         print(f"📈 Analyzing {len(available_players)} waiver targets...")
         
-        targets = []
-        progress = ProgressBar(len(available_players), "Evaluating waiver wire")
-        
-        for player_name in available_players:
-            progress.update()
-            try:
-                analysis = self.analyzer.get_player_analysis(player_name)
+        candidates = []
+        ownerships = []
+        for analysis in self.analyzer.analyze_players(available_players, "Evaluating waiver wire"):
+            if (analysis.fantasy_projection and 
+                analysis.position in roster_needs and
+                analysis.roster_info):
                 
-                if (analysis.fantasy_projection and 
-                    analysis.position in roster_needs and
-                    analysis.roster_info):
-                    
-                    # Calculate ownership (would come from external source in real implementation)
-                    ownership = analysis.roster_info.ownership_projection or 25.0
-                    
-                    if ownership <= max_ownership:
-                        # Calculate priority score
-                        priority_score = self._calculate_waiver_priority(analysis, ownership)
-                        
-                        # Generate reason
-                        reason = self._generate_waiver_reason(analysis)
-                        
-                        targets.append(WaiverTarget(
-                            player_name=player_name,
-                            position=analysis.position,
-                            projected_points=analysis.fantasy_projection.projected_points,
-                            ownership_percent=ownership,
-                            priority_score=priority_score,
-                            reason=reason
-                        ))
-                        
-            except Exception as e:
-                print(f"\n⚠️  Could not analyze {player_name}: {e}")
-                continue
-        
-        # Sort by priority score
-        targets.sort(key=lambda x: x.priority_score, reverse=True)
-        
-        return targets
+                # Calculate ownership (would come from external source in real implementation)
+                ownership = analysis.roster_info.ownership_projection or 25.0
+                
+                if ownership <= max_ownership:
+                    candidates.append(analysis)
+                    ownerships.append(ownership)
+        
+        # Score every candidate at once
+        priority_scores = self._calculate_waiver_priorities(candidates, np.array(ownerships, dtype=float))
+        
+        # Rank by priority score, only building targets that will be returned
+        return [
+            WaiverTarget(
+                player_name=candidates[i].player_name,
+                position=candidates[i].position,
+                projected_points=candidates[i].fantasy_projection.projected_points,
+                ownership_percent=ownerships[i],
+                priority_score=float(priority_scores[i]),
+                reason=self._generate_waiver_reason(candidates[i])
+            )
+            for i in _rank_scores(priority_scores, top_k)
+        ]
     
-    def _calculate_waiver_priority(self, analysis: PlayerProps, ownership: float) -> float:
-        """Calculate waiver wire priority score"""
-        if not analysis.fantasy_projection:
-            return 0.0
-        
-        # Base score from projected points
-        base_score = analysis.fantasy_projection.projected_points
-        
-        # Boost for low ownership (hidden gems)
-        ownership_boost = (100 - ownership) / 100 * 5
-        
-        # Confidence boost
-        confidence_boost = analysis.fantasy_projection.confidence * 3
-        
-        return base_score + ownership_boost + confidence_boost
+    def _calculate_waiver_priorities(self, analyses: List[PlayerProps], ownership: np.ndarray) -> np.ndarray:
+        """Calculate waiver wire priority scores for projected players"""
+        points = np.fromiter((a.fantasy_projection.projected_points for a in analyses), dtype=float, count=len(analyses))
+        confidence = np.fromiter((a.fantasy_projection.confidence for a in analyses), dtype=float, count=len(analyses))
+        
+        # Base score from projected points, a boost for low ownership (hidden
+        # gems) and a confidence boost
+        return points + (100 - ownership) / 100 * 5 + confidence * 3
     
     def _generate_waiver_reason(self, analysis: PlayerProps) -> str:
         """Generate explanation for waiver wire recommendation"""
@@ -390,13 +524,16 @@ class FantasyTools:
         else:
             return "Speculative add with potential upside"
     
-    def simulate_season(self, roster_players: List[str], weeks: int = 17) -> Dict[str, Any]:
+    def simulate_season(self, roster_players: List[str], weeks: int = 17,
+                        seed: Optional[int] = None) -> Dict[str, Any]:
         """
         Simulate full season performance for roster evaluation.
         
         Args:
             roster_players: List of players on roster
             weeks: Number of weeks to simulate
+            seed: Seed for the weekly variance draws; pass one for reproducible
+                results (random.seed / np.random.seed don't affect them)
             
         Returns:
             Dictionary with season simulation results
@@ -407,117 +544,96 @@ class FantasyTools:
         # - Bye week management
         # - Variance in performance
         
-        weekly_scores = []
-        player_totals = {}
+        # Projections don't change from week to week here, so optimize once and
+        # only vary the outcome
+        optimal_lineup = self.analyzer.optimize_lineup(roster_players)
+        projected_points = optimal_lineup.get('total_projected_points')
+        lineup_groups = [players for players in optimal_lineup.get('optimal_lineup', {}).values() if players]
         
-        for week in range(1, weeks + 1):
-            week_score = 0
-            optimal_lineup = self.analyzer.optimize_lineup(roster_players)
-            
-            if 'total_projected_points' in optimal_lineup:
-                # Add some variance (±20% standard deviation)
-                import random
-                variance = random.gauss(1.0, 0.2)
-                week_score = optimal_lineup['total_projected_points'] * variance
-            
-            weekly_scores.append(week_score)
-            
-            # Track individual player performance
-            for position, players in optimal_lineup.get('optimal_lineup', {}).items():
-                for player in players:
-                    if player not in player_totals:
-                        player_totals[player] = 0
-                    # Simplified individual scoring
-                    player_totals[player] += week_score / len(players)
+        if projected_points is not None:
+            # Add some variance (±20% standard deviation), drawn for every week at once
+            rng = np.random.default_rng(seed)
+            weekly_scores = projected_points * rng.normal(1.0, 0.2, size=weeks)
+        else:
+            weekly_scores = np.zeros(weeks)
+        
+        # Track individual player performance (simplified individual scoring)
+        season_points = float(weekly_scores.sum())
+        player_totals = {
+            player: season_points / len(players)
+            for players in lineup_groups
+            for player in players
+        }
         
         return {
-            'total_points': sum(weekly_scores),
-            'average_weekly_score': sum(weekly_scores) / len(weekly_scores),
-            'best_week': max(weekly_scores),
-            'worst_week': min(weekly_scores),
-            'weekly_scores': weekly_scores,
+            'total_points': season_points,
+            'average_weekly_score': season_points / weeks,
+            'best_week': float(weekly_scores.max()),
+            'worst_week': float(weekly_scores.min()),
+            'weekly_scores': weekly_scores.tolist(),
             'player_totals': player_totals,
-            'projected_wins': len([score for score in weekly_scores if score > 110])  # Assuming 110 is average
+            'projected_wins': int((weekly_scores > 110).sum())  # Assuming 110 is average
         }
     
     def get_breakout_candidates(self, player_pool: List[str], 
-                              min_confidence: float = 0.6) -> List[Dict[str, Any]]:
+                              min_confidence: float = 0.6, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Identify potential breakout candidates based on betting market inefficiencies.
         
         Args:
             player_pool: List of players to analyze
             min_confidence: Minimum confidence threshold
+            top_k: Only return this many of the best candidates (all when None)
             
         Returns:
             List of breakout candidates with analysis
         """
         print(f"🚀 Analyzing {len(player_pool)} breakout candidates...")
         
-        breakout_candidates = []
-        progress = ProgressBar(len(player_pool), "Finding breakouts")
-        
-        for player_name in player_pool:
-            progress.update()
-            try:
-                analysis = self.analyzer.get_player_analysis(player_name)
-                
-                if (analysis.fantasy_projection and 
-                    analysis.fantasy_projection.confidence >= min_confidence):
-                    
-                    # Look for signs of breakout potential
-                    breakout_score = self._calculate_breakout_potential(analysis)
-                    
-                    if breakout_score > 7.0:  # Arbitrary threshold
-                        breakout_candidates.append({
-                            'player_name': player_name,
-                            'position': analysis.position.value if analysis.position else 'Unknown',
-                            'projected_points': analysis.fantasy_projection.projected_points,
-                            'confidence': analysis.fantasy_projection.confidence,
-                            'breakout_score': breakout_score,
-                            'team': analysis.roster_info.team if analysis.roster_info else 'Unknown',
-                            'reasoning': self._generate_breakout_reasoning(analysis, breakout_score)
-                        })
-                        
-            except Exception as e:
-                print(f"\n⚠️  Could not analyze {player_name}: {e}")
-                continue
-        
-        # Sort by breakout score
-        breakout_candidates.sort(key=lambda x: x['breakout_score'], reverse=True)
-        
-        return breakout_candidates
+        candidates = [
+            analysis for analysis in self.analyzer.analyze_players(player_pool, "Finding breakouts")
+            if analysis.fantasy_projection and analysis.fantasy_projection.confidence >= min_confidence
+        ]
+        
+        # Look for signs of breakout potential
+        breakout_scores = self._calculate_breakout_potentials(candidates)
+        
+        # Rank players clearing the (arbitrary) breakout threshold, only
+        # building entries that will be returned
+        eligible = np.flatnonzero(breakout_scores > 7.0)
+        ranked = eligible[_rank_scores(breakout_scores[eligible], top_k)]
+        return [
+            {
+                'player_name': candidates[i].player_name,
+                'position': candidates[i].position.value if candidates[i].position else 'Unknown',
+                'projected_points': candidates[i].fantasy_projection.projected_points,
+                'confidence': candidates[i].fantasy_projection.confidence,
+                'breakout_score': float(breakout_scores[i]),
+                'team': candidates[i].roster_info.team if candidates[i].roster_info else 'Unknown',
+                'reasoning': self._generate_breakout_reasoning(candidates[i], breakout_scores[i])
+            }
+            for i in ranked
+        ]
     
-    def _calculate_breakout_potential(self, analysis: PlayerProps) -> float:
-        """Calculate breakout potential score"""
-        if not analysis.fantasy_projection:
-            return 0.0
+    def _calculate_breakout_potentials(self, analyses: List[PlayerProps]) -> np.ndarray:
+        """Calculate breakout potential scores for projected players"""
+        count = len(analyses)
+        projections = [a.fantasy_projection for a in analyses]
         
-        # Base on high projection with high confidence
-        base_score = analysis.fantasy_projection.projected_points * analysis.fantasy_projection.confidence
+        def breakdown(category: str) -> np.ndarray:
+            return np.fromiter((p.breakdown.get(category, 0) for p in projections), dtype=float, count=count)
         
-        # Look for specific indicators in the breakdown
-        rushing_upside = analysis.fantasy_projection.breakdown.get('rushing_yards', 0) > 30
-        receiving_upside = analysis.fantasy_projection.breakdown.get('receiving_yards', 0) > 60
-        td_upside = analysis.fantasy_projection.breakdown.get('receiving_tds', 0) > 0.5
+        # Base on high projection with high confidence
+        scores = (np.fromiter((p.projected_points for p in projections), dtype=float, count=count) *
+                  np.fromiter((p.confidence for p in projections), dtype=float, count=count))
         
         # Boost score for multi-category upside
-        if rushing_upside:
-            base_score += 2
-        if receiving_upside:
-            base_score += 2
-        if td_upside:
-            base_score += 3
-            
-        return base_score
+        scores += 2 * (breakdown('rushing_yards') > 30)
+        scores += 2 * (breakdown('receiving_yards') > 60)
+        scores += 3 * (breakdown('receiving_tds') > 0.5)
+        
+        return scores
     
     def _generate_breakout_reasoning(self, analysis: PlayerProps, breakout_score: float) -> str:
         """Generate reasoning for breakout candidate"""
-        if breakout_score > 15:
-            return "Elite projection with multiple touchdown upside categories"
-        elif breakout_score > 12:
-            return "Strong multi-category potential with high confidence"
-        elif breakout_score > 9:
-            return "Solid upside play with reliable floor"
-        else:
-            return "Speculative breakout candidate with moderate upside"
+        return _ladder_message(_BREAKOUT_REASONS, breakout_score)
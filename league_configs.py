@@ -8,314 +8,210 @@ Author: FantasyEdge
 Date: 2024-2025
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Callable, Dict, Mapping, Optional, Tuple
+from types import MappingProxyType
 from betting_lines_fetcher import FantasyScoring, Position
 
 
-@dataclass
+# Shared, read-only roster requirements; configs (and PositionRequirements)
+# reference these rather than each building their own copy
+STANDARD_ROSTER = MappingProxyType({
+    Position.QB: 1,
+    Position.RB: 2,
+    Position.WR: 2,
+    Position.TE: 1,
+    Position.K: 1,
+    Position.DST: 1
+})
+
+DRAFTKINGS_ROSTER = MappingProxyType({
+    Position.QB: 1,
+    Position.RB: 2,
+    Position.WR: 3,
+    Position.TE: 1,
+    Position.K: 1,
+    Position.DST: 1
+})
+
+TWO_QB_ROSTER = MappingProxyType({
+    Position.QB: 2,
+    Position.RB: 2,
+    Position.WR: 2,
+    Position.TE: 1,
+    Position.K: 1,
+    Position.DST: 1
+})
+
+
+@dataclass(frozen=True, slots=True)
 class LeagueConfig:
     """Complete league configuration including scoring and roster requirements"""
     name: str
     scoring: FantasyScoring
-    roster_requirements: Dict[Position, int]
+    roster_requirements: Mapping[Position, int] = field(hash=False)  # Mappings aren't hashable
     bench_spots: int = 6
     total_roster_size: int = 16
     trade_deadline_week: int = 10
-    playoff_weeks: List[int] = None
-    
-    def __post_init__(self):
-        if self.playoff_weeks is None:
-            self.playoff_weeks = [14, 15, 16]
+    playoff_weeks: Tuple[int, ...] = (14, 15, 16)
+
+
+# Common baseline scoring (full PPR, 4 pt passing TDs); formats below only
+# spell out where they differ
+_BASE_SCORING = FantasyScoring(
+    pass_yards_per_point=25.0,
+    pass_td_points=4.0,
+    pass_interception_points=-2.0,
+    rush_yards_per_point=10.0,
+    rush_td_points=6.0,
+    reception_points=1.0,
+    receiving_yards_per_point=10.0,
+    receiving_td_points=6.0,
+    fg_points=3.0,
+    extra_point_points=1.0
+)
+
+# Variants shared by more than one format
+_HALF_PPR_SCORING = replace(_BASE_SCORING, reception_points=0.5)
+_QB_PREMIUM_SCORING = replace(_BASE_SCORING, pass_td_points=6.0)  # 6 pt passing TDs
 
 
 class LeagueConfigs:
-    """Pre-defined league configurations for popular formats"""
+    """
+    Pre-defined league configurations for popular formats.
+    
+    Each factory builds its (frozen) configuration on first call and returns
+    that same instance afterwards.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def standard_ppr() -> LeagueConfig:
         """Standard PPR (Point Per Reception) league"""
         return LeagueConfig(
             name="Standard PPR",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=4.0,
-                pass_interception_points=-2.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=1.0,  # Full PPR
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
-            ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            scoring=_BASE_SCORING,  # Full PPR
+            roster_requirements=STANDARD_ROSTER,
             bench_spots=6
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def half_ppr() -> LeagueConfig:
         """Half PPR league"""
         return LeagueConfig(
             name="Half PPR",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=4.0,
-                pass_interception_points=-2.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=0.5,  # Half PPR
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
-            ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            scoring=_HALF_PPR_SCORING,
+            roster_requirements=STANDARD_ROSTER,
             bench_spots=6
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def standard_non_ppr() -> LeagueConfig:
         """Standard non-PPR league"""
         return LeagueConfig(
             name="Standard (Non-PPR)",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=4.0,
-                pass_interception_points=-2.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=0.0,  # No PPR
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
-            ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            scoring=replace(_BASE_SCORING, reception_points=0.0),  # No PPR
+            roster_requirements=STANDARD_ROSTER,
             bench_spots=6
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def superflex() -> LeagueConfig:
         """Superflex league (QB premium)"""
         return LeagueConfig(
             name="Superflex",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=6.0,  # QB premium
-                pass_interception_points=-2.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=1.0,
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
-            ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-                # Note: Superflex spot would be handled as a FLEX position
-            },
+            scoring=_QB_PREMIUM_SCORING,
+            roster_requirements=STANDARD_ROSTER,  # Note: Superflex spot would be handled as a FLEX position
             bench_spots=6
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def draftkings_dfs() -> LeagueConfig:
         """DraftKings DFS scoring"""
         return LeagueConfig(
             name="DraftKings DFS",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=4.0,
+            scoring=replace(
+                _BASE_SCORING,
                 pass_interception_points=-1.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=1.0,
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0,
                 long_td_bonus=3.0,  # 40+ yard TD bonus
                 long_pass_bonus=3.0,  # 300+ yard bonus
                 long_rush_bonus=3.0,  # 100+ yard bonus
                 long_receiving_bonus=3.0  # 100+ yard bonus
             ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 3,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            roster_requirements=DRAFTKINGS_ROSTER,
             bench_spots=0  # No bench in DFS
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def fanduel_dfs() -> LeagueConfig:
         """FanDuel DFS scoring"""
         return LeagueConfig(
             name="FanDuel DFS",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=4.0,
+            scoring=replace(
+                _BASE_SCORING,
                 pass_interception_points=-1.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=0.5,  # Half PPR
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
+                reception_points=0.5  # Half PPR
             ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            roster_requirements=STANDARD_ROSTER,
             bench_spots=0  # No bench in DFS
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def dynasty_ppr() -> LeagueConfig:
         """Dynasty league with deeper rosters"""
         return LeagueConfig(
             name="Dynasty PPR",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=4.0,
-                pass_interception_points=-2.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=1.0,
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
-            ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            scoring=_BASE_SCORING,
+            roster_requirements=STANDARD_ROSTER,
             bench_spots=15,  # Deeper benches for dynasty
             total_roster_size=22,
             trade_deadline_week=12  # Later trade deadline
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def best_ball() -> LeagueConfig:
         """Best Ball league (no weekly lineup changes)"""
         return LeagueConfig(
             name="Best Ball",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=4.0,
-                pass_interception_points=-2.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=0.5,  # Half PPR common in best ball
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
-            ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            scoring=_HALF_PPR_SCORING,  # Half PPR common in best ball
+            roster_requirements=STANDARD_ROSTER,
             bench_spots=11,  # Larger roster for best ball
             total_roster_size=18
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def two_qb() -> LeagueConfig:
         """Two QB league"""
         return LeagueConfig(
             name="Two QB",
-            scoring=FantasyScoring(
-                pass_yards_per_point=25.0,
-                pass_td_points=6.0,  # QB premium
-                pass_interception_points=-2.0,
-                rush_yards_per_point=10.0,
-                rush_td_points=6.0,
-                reception_points=1.0,
-                receiving_yards_per_point=10.0,
-                receiving_td_points=6.0,
-                fg_points=3.0,
-                extra_point_points=1.0
-            ),
-            roster_requirements={
-                Position.QB: 2,  # Two QBs required
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            scoring=_QB_PREMIUM_SCORING,
+            roster_requirements=TWO_QB_ROSTER,  # Two QBs required
             bench_spots=6
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def chimpzone_2025() -> LeagueConfig:
         """ChimpZone 2025 league with custom scoring"""
         return LeagueConfig(
             name="ChimpZone 2025",
-            scoring=FantasyScoring(
-                # Passing - 6 pt passing TDs, 0.04 per yard
-                pass_yards_per_point=25.0,  # 25 yards = 1 point
-                pass_td_points=6.0,  # 6 points per passing TD
+            scoring=replace(
+                _BASE_SCORING,
+                # Passing - 6 pt passing TDs, 0.04 per yard (25 yards = 1 point)
+                pass_td_points=6.0,
                 pass_interception_points=-1.0,  # -1 for interceptions
-                pass_completion_points=0.0,
-                
-                # Rushing - standard 0.1 per yard, 6 pt TDs
-                rush_yards_per_point=10.0,  # 10 yards = 1 point
-                rush_td_points=6.0,
                 
-                # Receiving - Full PPR, 0.1 per yard, 6 pt TDs
-                reception_points=1.0,  # Full PPR
-                receiving_yards_per_point=10.0,  # 10 yards = 1 point
-                receiving_td_points=6.0,
-                
-                # Kicking - Variable FG scoring
-                fg_points=3.0,  # Base FG points (0-39 yards)
-                extra_point_points=1.0,
+                # Rushing and receiving - 0.1 per yard, 6 pt TDs, full PPR
+                # Kicking - Variable FG scoring, 3 base points (0-39 yards)
                 
                 # Bonuses - ChimpZone specific
                 long_td_bonus=2.5,  # 50+ yard TD bonus
@@ -323,92 +219,76 @@ class LeagueConfigs:
                 long_rush_bonus=2.5,  # 200+ yard rushing bonus
                 long_receiving_bonus=2.5  # 200+ yard receiving bonus
             ),
-            roster_requirements={
-                Position.QB: 1,
-                Position.RB: 2,
-                Position.WR: 2,
-                Position.TE: 1,
-                Position.K: 1,
-                Position.DST: 1
-            },
+            roster_requirements=STANDARD_ROSTER,
             bench_spots=6,
             total_roster_size=13,  # 7 starters + 6 bench
             trade_deadline_week=11,
-            playoff_weeks=[15, 16, 17]  # Playoffs start week 15
+            playoff_weeks=(15, 16, 17)  # Playoffs start week 15
         )
 
     @staticmethod
     def get_all_configs() -> Dict[str, LeagueConfig]:
         """Get all available league configurations"""
-        return {
-            "standard_ppr": LeagueConfigs.standard_ppr(),
-            "half_ppr": LeagueConfigs.half_ppr(),
-            "standard_non_ppr": LeagueConfigs.standard_non_ppr(),
-            "superflex": LeagueConfigs.superflex(),
-            "draftkings_dfs": LeagueConfigs.draftkings_dfs(),
-            "fanduel_dfs": LeagueConfigs.fanduel_dfs(),
-            "dynasty_ppr": LeagueConfigs.dynasty_ppr(),
-            "best_ball": LeagueConfigs.best_ball(),
-            "two_qb": LeagueConfigs.two_qb(),
-            "chimpzone_2025": LeagueConfigs.chimpzone_2025()
-        }
+        return dict(_all_configs())
     
     @staticmethod
     def get_config_by_name(name: str) -> Optional[LeagueConfig]:
         """Get a specific league configuration by name"""
-        configs = LeagueConfigs.get_all_configs()
-        return configs.get(name.lower().replace(" ", "_").replace("-", "_"))
+        # Exact registry keys skip normalization
+        factory = _CONFIG_FACTORIES.get(name)
+        if factory is not None:
+            return factory()
+        
+        key = name.lower().translate(_NAME_SEPARATORS)
+        
+        # Registry keys only build the requested config; display names need
+        # every config built to know their names
+        factory = _CONFIG_FACTORIES.get(key)
+        if factory is not None:
+            return factory()
+        return _configs_by_display_name().get(key)
+
+
+# Registry key -> factory; configs are only built when first asked for
+_CONFIG_FACTORIES: Dict[str, Callable[[], LeagueConfig]] = {
+    "standard_ppr": LeagueConfigs.standard_ppr,
+    "half_ppr": LeagueConfigs.half_ppr,
+    "standard_non_ppr": LeagueConfigs.standard_non_ppr,
+    "superflex": LeagueConfigs.superflex,
+    "draftkings_dfs": LeagueConfigs.draftkings_dfs,
+    "fanduel_dfs": LeagueConfigs.fanduel_dfs,
+    "dynasty_ppr": LeagueConfigs.dynasty_ppr,
+    "best_ball": LeagueConfigs.best_ball,
+    "two_qb": LeagueConfigs.two_qb,
+    "chimpzone_2025": LeagueConfigs.chimpzone_2025
+}
+
+
+@lru_cache(maxsize=1)
+def _all_configs() -> Dict[str, LeagueConfig]:
+    """Build every pre-defined configuration once; they're static reference data"""
+    return {key: factory() for key, factory in _CONFIG_FACTORIES.items()}
+
+
+# Spaces and hyphens in a requested name both map to underscores
+_NAME_SEPARATORS = str.maketrans(" -", "__")
+
+
+@lru_cache(maxsize=1)
+def _configs_by_display_name() -> Dict[str, LeagueConfig]:
+    """Configurations keyed by normalized display name"""
+    return {config.name.lower().translate(_NAME_SEPARATORS): config for config in _all_configs().values()}
 
 
 # Position requirements for different league formats
 class PositionRequirements:
     """Standard position requirements for different league formats"""
     
-    STANDARD = {
-        Position.QB: 1,
-        Position.RB: 2,
-        Position.WR: 2,
-        Position.TE: 1,
-        Position.K: 1,
-        Position.DST: 1
-    }
-    
-    DRAFTKINGS = {
-        Position.QB: 1,
-        Position.RB: 2,
-        Position.WR: 3,
-        Position.TE: 1,
-        Position.K: 1,
-        Position.DST: 1
-    }
-    
-    FANDUEL = {
-        Position.QB: 1,
-        Position.RB: 2,
-        Position.WR: 2,
-        Position.TE: 1,
-        Position.K: 1,
-        Position.DST: 1
-    }
-    
-    SUPERFLEX = {
-        Position.QB: 1,
-        Position.RB: 2,
-        Position.WR: 2,
-        Position.TE: 1,
-        Position.K: 1,
-        Position.DST: 1
-        # Additional QB/RB/WR/TE flex spot would be handled separately
-    }
-    
-    TWO_QB = {
-        Position.QB: 2,
-        Position.RB: 2,
-        Position.WR: 2,
-        Position.TE: 1,
-        Position.K: 1,
-        Position.DST: 1
-    }
+    STANDARD = STANDARD_ROSTER
+    DRAFTKINGS = DRAFTKINGS_ROSTER
+    FANDUEL = STANDARD_ROSTER
+    SUPERFLEX = STANDARD_ROSTER  # Additional QB/RB/WR/TE flex spot would be handled separately
+    TWO_QB = TWO_QB_ROSTER
 
 
 # Common salary caps for DFS sites
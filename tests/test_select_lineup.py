@@ -0,0 +1,129 @@
+"""
+Regression tests for FantasyEdgeAnalyzer._select_lineup under a salary cap,
+checked against brute force over every legal lineup.
+
+Run with: python -m unittest discover tests
+"""
+
+import itertools
+import os
+import random
+import sys
+import tracemalloc
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from betting_lines_fetcher import (
+    FantasyEdgeAnalyzer, FantasyProjection, PlayerProps, PlayerRosterInfo, Position
+)
+
+REQUIREMENTS = {Position.QB: 1, Position.RB: 2, Position.WR: 2, Position.TE: 1}
+FLEX_SPOTS = 1
+POOL_SIZES = {Position.QB: 3, Position.RB: 4, Position.WR: 5, Position.TE: 3}
+
+
+def make_player(name: str, position: Position, points: float, salary: int) -> PlayerProps:
+    roster_info = PlayerRosterInfo(
+        player_name=name, position=position, team="NFL", opponent="NFL",
+        game_time=datetime(2025, 9, 7), salary=salary
+    )
+    projection = FantasyProjection(
+        player_name=name, position=position, projected_points=points,
+        confidence=1.0, breakdown={}
+    )
+    return PlayerProps(name, position, roster_info, [], projection)
+
+
+def random_pool(rng: random.Random, salary_step: int = 100):
+    pool = {}
+    for position, size in POOL_SIZES.items():
+        players = [
+            make_player(f"{position.value}{i}", position, round(rng.uniform(5, 25), 2),
+                        rng.randrange(3000, 9000, salary_step))
+            for i in range(size)
+        ]
+        players.sort(key=lambda p: p.fantasy_projection.projected_points, reverse=True)
+        pool[position] = players
+    return pool
+
+
+def points(players) -> float:
+    return sum(p.fantasy_projection.projected_points for p in players)
+
+
+def salary(players) -> int:
+    return sum(p.roster_info.salary for p in players)
+
+
+def best_full_lineup(pool, salary_cap: int):
+    """Highest-scoring lineup filling every slot under the cap, or None"""
+    best = None
+    fixed_slots = [itertools.combinations(pool[pos], count) for pos, count in REQUIREMENTS.items()]
+    for picks in itertools.product(*fixed_slots):
+        starters = [p for group in picks for p in group]
+        taken = {p.player_name for p in starters}
+        leftovers = [p for pos in FantasyEdgeAnalyzer.FLEX_POSITIONS for p in pool[pos]
+                     if p.player_name not in taken]
+        for flex in itertools.combinations(leftovers, FLEX_SPOTS):
+            lineup = starters + list(flex)
+            if salary(lineup) <= salary_cap and (best is None or points(lineup) > best):
+                best = points(lineup)
+    return best
+
+
+class SelectLineupTests(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = FantasyEdgeAnalyzer.__new__(FantasyEdgeAnalyzer)
+
+    def select(self, pool, salary_cap):
+        optimal_lineup, flex = self.analyzer._select_lineup(pool, REQUIREMENTS, FLEX_SPOTS, salary_cap)
+        return [p for players in optimal_lineup.values() for p in players] + flex
+
+    def test_fills_every_slot_when_a_full_lineup_fits(self):
+        slots = sum(REQUIREMENTS.values()) + FLEX_SPOTS
+        checked = 0
+        for seed in range(200):
+            rng = random.Random(seed)
+            pool = random_pool(rng)
+            salary_cap = rng.randrange(30000, 40001, 1000)
+
+            lineup = self.select(pool, salary_cap)
+            self.assertLessEqual(salary(lineup), salary_cap, f"seed {seed}")
+
+            best = best_full_lineup(pool, salary_cap)
+            if best is None:
+                continue
+            checked += 1
+            self.assertEqual(len(lineup), slots, f"seed {seed}")
+            self.assertAlmostEqual(points(lineup), best, places=6, msg=f"seed {seed}")
+
+        self.assertGreater(checked, 0)
+
+    def test_memory_stays_bounded_for_non_round_salaries(self):
+        # Salaries with no common divisor leave the raw cap as the capacity axis
+        rng = random.Random(0)
+        pool = {}
+        for position, size in {Position.QB: 4, Position.RB: 8, Position.WR: 11, Position.TE: 5}.items():
+            pool[position] = [
+                make_player(f"{position.value}{i}", position, round(rng.uniform(5, 25), 2),
+                            rng.randrange(3000, 9000) | 1)
+                for i in range(size)
+            ]
+        salary_cap = 50000
+
+        tracemalloc.start()
+        try:
+            lineup = self.select(pool, salary_cap)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(peak, 150 * 1024 * 1024)
+        self.assertLessEqual(salary(lineup), salary_cap)
+        self.assertEqual(len(lineup), sum(REQUIREMENTS.values()) + FLEX_SPOTS)
+
+
+if __name__ == "__main__":
+    unittest.main()